@@ -6,7 +6,7 @@ This script monitors a YouTube channel's RSS feed (or YouTube API) for new video
 and automatically posts about them on Bluesky with a rich preview card.
 
 Requirements (install with pip):
-    pip install feedparser atproto requests pyyaml
+    pip install atproto requests pyyaml
 
 Usage:
     Normal mode (monitor and post):
@@ -33,23 +33,69 @@ Usage:
 # IMPORTS - These are external libraries we need
 # ============================================================
 
-import feedparser      # Parses RSS/Atom feeds (pip install feedparser)
 import time            # For sleeping between checks
 import os              # For file path operations
-import json            # For saving/loading seen videos
+import json            # For reading the old seen videos file and API responses
+import sqlite3         # For the database of seen videos (built-in)
 import requests        # For downloading thumbnails (pip install requests)
+from requests.adapters import HTTPAdapter  # For connection pooling and retries
+from urllib3.util.retry import Retry       # Retry policy for HTTP requests (installed with requests)
 import argparse        # For parsing command line arguments (built-in)
 import yaml            # For parsing YAML config files (pip install pyyaml)
 import sys             # For exiting the script with exit codes
 import logging         # For structured logging to console and file (built-in)
 from logging.handlers import RotatingFileHandler  # For automatic log rotation
-import traceback       # For detailed exception tracebacks in logs (built-in)
-from datetime import datetime  # For timestamps in logs
-
-# The Bluesky/AT Protocol library (pip install atproto)
+from logging.handlers import QueueHandler, QueueListener  # For background log writing
+import queue           # Thread-safe queue between the logger and the log writer
+import atexit          # For flushing the log writer on shutdown (built-in)
+import signal          # For shutting down cleanly on Ctrl+C / SIGTERM (built-in)
+import threading       # For the periodic log flush timer (built-in)
+from concurrent.futures import ThreadPoolExecutor  # For running downloads in parallel (built-in)
+import xml.etree.ElementTree as ET  # For parsing the YouTube RSS/Atom feed (built-in)
+import string          # For parsing the post template once (built-in)
+import re              # For finding video IDs in URLs (built-in)
+from functools import lru_cache  # For remembering video IDs already extracted (built-in)
+import random          # For adding jitter to the check interval (built-in)
+import io              # For in-memory buffers when downloading thumbnails (built-in)
+import shutil          # For copying streamed downloads in chunks (built-in)
+from email.utils import parsedate_to_datetime  # For parsing HTTP-date Retry-After headers
+from datetime import datetime, timezone, timedelta  # For reading video publish dates (built-in)
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # For the YouTube API quota day (built-in)
+
+# The Bluesky/AT Protocol library (pip install atproto) is NOT imported here.
+# It pulls in a large set of dependencies and takes close to a second to
+# load, so it is imported inside get_bluesky_client() and post_to_bluesky()
+# the first time it is needed. This keeps --help and --build-db fast.
 # Client: handles authentication and API calls
 # models: contains data structures for embeds, posts, etc.
-from atproto import Client, models
+
+# The modules only used by --push (http.server, urllib.parse, hmac,
+# hashlib and secrets) are imported inside make_websub_handler(),
+# start_websub_server() and subscribe_websub(), so normal polling runs
+# don't load them.
+
+# Optional faster JSON parser (pip install orjson)
+# If it isn't installed we fall back to the built-in json module.
+# orjson's decode error is a subclass of json.JSONDecodeError, so the
+# existing except blocks catch errors from either parser.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# The optional image library Pillow (pip install Pillow) is not imported
+# here either. Only posting needs it, so shrink_thumbnail() imports it the
+# first time a thumbnail is uploaded. Without it, thumbnails are uploaded
+# as downloaded.
+
+# Use PyYAML's C-based safe loader (libyaml) when it is available.
+# It is much faster than the pure-Python loader and just as safe.
+# PyYAML wheels normally include it; otherwise fall back to SafeLoader.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 
 # ============================================================
@@ -67,6 +113,10 @@ class Colors:
         print(f"{Colors.RED}This is red{Colors.RESET}")
     
     Note: Always use RESET after colored text to return to default color.
+    
+    When output is not a terminal (piped, redirected to a file, or
+    captured by systemd), or the NO_COLOR environment variable is set,
+    main() calls Colors.disable() so no escape codes end up in the output.
     """
     RED = '\033[91m'       # Bright red for errors
     GREEN = '\033[92m'     # Bright green for success
@@ -77,6 +127,12 @@ class Colors:
     RESET = '\033[0m'      # Reset to default terminal color
     BOLD = '\033[1m'       # Bold text (can combine with colors)
 
+    @classmethod
+    def disable(cls):
+        """Turns all colors into empty strings (plain text output)."""
+        for name in ("RED", "GREEN", "YELLOW", "BLUE", "MAGENTA", "CYAN", "RESET", "BOLD"):
+            setattr(cls, name, "")
+
 
 # ============================================================
 # LOGGING SETUP - File logger for the --log option
@@ -88,28 +144,175 @@ class Colors:
 # also write to this logger when it is active
 file_logger = None
 
+# True when debug messages are actually written somewhere (--log)
+# Checked first thing in log_debug(), and by call sites that would
+# otherwise build expensive debug values (e.g. json.dumps of a response)
+debug_log_enabled = False
+
 # The log file name, placed in the same directory as the running script
 LOG_FILE_NAME = "skytube.log"
 
+# Full path to the log file, worked out once at startup from the current
+# working directory. Resolving it here means the path stays the same even
+# if something changes the working directory later on.
+LOG_FILE_PATH = os.path.join(os.getcwd(), LOG_FILE_NAME)
+
 # Maximum log file size before rotation (10 MB)
 MAX_LOG_SIZE_BYTES = 10 * 1024 * 1024
 
+# Size of the in-memory write buffer for the log file (64 KB)
+# Log lines are collected here and written to disk in larger chunks
+LOG_BUFFER_SIZE = 64 * 1024
+
+# How often buffered log lines are flushed to disk (in seconds)
+# WARNING and ERROR lines are always flushed immediately
+LOG_FLUSH_INTERVAL_SECONDS = 30
+
+# The background listener that owns the log file handler
+# Set by setup_file_logging() so it can be stopped (and flushed) on exit
+file_log_listener = None
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler that buffers log lines in memory.
+    
+    The stock handler flushes the file after every single record, which
+    means one write() system call per log line. This handler opens the
+    log file with a LOG_BUFFER_SIZE buffer and only flushes it:
+    - every LOG_FLUSH_INTERVAL_SECONDS seconds (background timer thread)
+    - immediately for WARNING and ERROR records, so problems are on disk
+    - when the handler is closed (on exit)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Number of bytes in the log file, tracked in memory so that
+        # shouldRollover() never has to ask the filesystem
+        # Seeded from the already open file since we open it in append mode
+        if self.stream is not None:
+            self._bytes_written = os.fstat(self.stream.fileno()).st_size
+        else:
+            self._bytes_written = 0
+
+        # Set when the handler is closed to stop the flush timer thread
+        self._flush_stop = threading.Event()
+
+        # Daemon thread so it never keeps the script alive on exit
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically,
+            name="skytube-log-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_periodically(self):
+        """Flushes the buffer every LOG_FLUSH_INTERVAL_SECONDS until closed."""
+        # Event.wait returns True once the stop event is set
+        while not self._flush_stop.wait(LOG_FLUSH_INTERVAL_SECONDS):
+            self.flush()
+
+    def _open(self):
+        """Opens the log file in binary append mode with a large write buffer."""
+        return open(self.baseFilename, "ab", buffering=LOG_BUFFER_SIZE)
+
+    def shouldRollover(self, record):
+        """
+        Checks whether the log file has reached maxBytes.
+        
+        Uses the in-memory byte counter instead of stat()/seek()/tell()
+        on the file, so no system call is made per record. Seeking a
+        buffered file would also force the buffer to be flushed.
+        """
+        return self.maxBytes > 0 and self._bytes_written >= self.maxBytes
+
+    def doRollover(self):
+        """Clears the log file and resets the byte counter."""
+        super().doRollover()
+
+        # With backupCount=0 the stock handler just reopens the same file
+        # in append mode, so clear it ourselves
+        if self.backupCount == 0 and self.stream is not None:
+            self.stream.truncate(0)
+
+        self._bytes_written = 0
+
+    def emit(self, record):
+        """Writes the record into the buffer, flushing only for WARNING and above."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+
+            # The stream is binary, so encode the formatted line ourselves
+            msg = self.format(record) + self.terminator
+            data = msg.encode(self.encoding or "utf-8", self.errors or "strict")
+            self.stream.write(data)
+            self._bytes_written += len(data)
+
+            # Make sure warnings and errors are on disk right away
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """Stops the flush timer and closes (and flushes) the log file."""
+        self._flush_stop.set()
+        super().close()
+
+
+class CachedSecondFormatter(logging.Formatter):
+    """
+    A logging.Formatter that formats each timestamp second only once.
+    
+    The log format only shows whole seconds, so every record logged in
+    the same second gets the same timestamp string. Instead of calling
+    localtime() + strftime() for every record, the last formatted second
+    is cached and reused.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The second (as an int timestamp) and its formatted string
+        self._last_second = None
+        self._last_formatted = ""
+
+    def formatTime(self, record, datefmt=None):
+        """Returns the formatted timestamp, reusing it within the same second."""
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_formatted = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._last_second = second
+        return self._last_formatted
+
 
 def setup_file_logging():
     """
     Configures the file logger to write continuously to skytube.log.
     
     The log file is created in the same directory the script runs in.
-    Uses RotatingFileHandler which automatically clears the log file when
-    it reaches MAX_LOG_SIZE_BYTES (10 MB). When the limit is reached,
+    Uses BufferedRotatingFileHandler which automatically clears the log file
+    when it reaches MAX_LOG_SIZE_BYTES (10 MB). When the limit is reached,
     the log is cleared and writing continues from the beginning.
     
+    The file handler is not attached to the logger directly. Instead the
+    logger gets a QueueHandler, and a background QueueListener thread
+    takes records off the queue and writes them to the file. This way
+    logging calls from the monitoring loop never wait on disk I/O.
+    
     Returns:
         A configured logging.Logger instance writing to skytube.log
     """
-    # Determine the directory where the script is being run from
-    # os.getcwd() gives the current working directory
-    log_file_path = os.path.join(os.getcwd(), LOG_FILE_NAME)
+    global file_log_listener
+
+    # The log file lives in the directory the script was started from
+    # (resolved once at startup, see LOG_FILE_PATH)
+    log_file_path = LOG_FILE_PATH
 
     # Create a named logger specific to this application
     # Using a named logger avoids conflicts with other libraries' loggers
@@ -121,9 +324,9 @@ def setup_file_logging():
         return logger
 
     try:
-        # Create a rotating file handler that clears the log when it reaches 10 MB
+        # Create a buffered rotating file handler that clears the log when it reaches 10 MB
         # backupCount=0 means no backup files are kept - log is simply cleared
-        file_handler = RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_file_path, 
             maxBytes=MAX_LOG_SIZE_BYTES, 
             backupCount=0, 
@@ -133,14 +336,25 @@ def setup_file_logging():
 
         # Define the log format to match the console output style
         # Format: [YYYY-MM-DD HH:MM:SS] [LEVEL] Message
-        formatter = logging.Formatter(
+        # CachedSecondFormatter only formats the timestamp once per second
+        formatter = CachedSecondFormatter(
             fmt="[%(asctime)s] [%(levelname)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(formatter)
 
-        # Attach the handler to our logger
-        logger.addHandler(file_handler)
+        # Put a queue between the logger and the file handler
+        # The logger only does an in-memory queue.put(), while the
+        # listener thread does the actual (slow) file writes
+        log_queue = queue.Queue(-1)  # -1 means no size limit
+        logger.addHandler(QueueHandler(log_queue))
+
+        # Start the background thread that writes queued records to the file
+        file_log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        file_log_listener.start()
+
+        # Make sure everything still in the queue is written when the script exits
+        atexit.register(file_log_listener.stop)
 
         # Log a startup separator so each run is clearly visible in the file
         logger.info("=" * 60)
@@ -150,8 +364,10 @@ def setup_file_logging():
 
     except PermissionError:
         # Handle case where we cannot write to the log directory
-        print(f"{Colors.RED}[ERROR] Permission denied: cannot create log file at {log_file_path}{Colors.RESET}")
-        print(f"{Colors.YELLOW}Check that you have write permissions to this directory.{Colors.RESET}")
+        print_block([
+            f"{Colors.RED}[ERROR] Permission denied: cannot create log file at {log_file_path}{Colors.RESET}",
+            f"{Colors.YELLOW}Check that you have write permissions to this directory.{Colors.RESET}",
+        ])
         sys.exit(1)
     except OSError as e:
         # Handle other OS-level file errors (disk full, invalid path, etc.)
@@ -161,34 +377,48 @@ def setup_file_logging():
     return logger
 
 
-def _write_to_file_log(level, message):
+# Maps our log level names to standard logging levels
+# "SUCCESS" is not a standard level, so it is logged as INFO with a prefix
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "SUCCESS": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+def _write_to_file_log(level, fmt, *args, exc_info=None):
     """
     Writes a message to the file logger if file logging is enabled.
     
     This is an internal helper called by log_message, log_error, etc.
     It maps our color-based log levels to standard logging levels.
     
+    The message is passed as a %-style format string plus arguments,
+    so the final string is only built when it is actually going to be
+    written (i.e. --log was passed and the level is enabled).
+    
     Args:
         level: A string indicating the log level ("DEBUG", "INFO", "WARNING", "ERROR", "SUCCESS")
-        message: The message string to log
+        fmt: The message string to log, optionally with %s placeholders
+        *args: Values for the placeholders in fmt
+        exc_info: Optional exception whose traceback is appended to the message
     """
     # Only write if the file logger has been initialized (--log flag was passed)
     if file_logger is None:
         return
 
-    # Map our custom levels to standard logging levels
-    # "SUCCESS" is not a standard level, so we log it as INFO with a prefix
-    if level == "ERROR":
-        file_logger.error(message)
-    elif level == "WARNING":
-        file_logger.warning(message)
-    elif level == "SUCCESS":
-        file_logger.info(f"[SUCCESS] {message}")
-    elif level == "DEBUG":
-        file_logger.debug(message)
-    else:
-        # Default to INFO for general messages
-        file_logger.info(message)
+    # Default to INFO for unknown levels
+    levelno = LOG_LEVELS.get(level, logging.INFO)
+    if not file_logger.isEnabledFor(levelno):
+        return
+
+    if level == "SUCCESS":
+        fmt = "[SUCCESS] " + fmt
+
+    # logging applies the %-formatting itself, only when the record is handled
+    file_logger.log(levelno, fmt, *args, exc_info=exc_info)
 
 
 # ============================================================
@@ -217,10 +447,31 @@ post_template: "🎬 New video: {title}"
 # 300 = 5 minutes, 600 = 10 minutes, 900 = 15 minutes
 check_interval_seconds: 600
 
+# Optional: random variation of each wait between checks
+# 0.15 = +/- 15% (the default), 0 = always wait exactly the interval
+# check_interval_jitter: 0.15
+
+# Optional: after 5 checks in a row without new videos, slowly check
+# less often (up to 4x check_interval_seconds) until a new video shows up
+# idle_backoff: true
+
+# Optional: check less often for channels that rarely upload
+# The interval becomes half the average time between recent uploads,
+# but never shorter than check_interval_seconds and never longer
+# than max_check_interval_seconds (default 86400 = 1 day)
+# adaptive_check_interval: true
+# max_check_interval_seconds: 86400
+
 # File to store which videos we've already posted about
 # This prevents duplicate posts if the script restarts
+# Videos are stored in an SQLite database next to this file
+# (same name with a .db extension). An existing JSON file from older
+# versions is imported into the database automatically.
 seen_videos_file: "youtube_bluesky_seen.json"
 
+# Optional: explicit path for the seen videos database
+# seen_videos_db: "youtube_bluesky_seen.db"
+
 # =============================================
 # YouTube API Configuration (Optional)
 # =============================================
@@ -237,6 +488,10 @@ seen_videos_file: "youtube_bluesky_seen.json"
 # Only used when --use-api is enabled
 # api_max_results: 15
 
+# Daily YouTube API quota of your Google Cloud project (default 10000)
+# API requests stop for the day once this many units were used
+# youtube_api_quota_per_day: 10000
+
 # =============================================
 # Dual Mode Configuration (Optional)
 # =============================================
@@ -246,13 +501,257 @@ seen_videos_file: "youtube_bluesky_seen.json"
 # Default is "api" (API metadata is preferred)
 #
 # dual_mode_preference: "api"
+
+# =============================================
+# Push Mode Configuration (Optional)
+# =============================================
+# When using --push, YouTube notifies the script about new uploads
+# through WebSub (PubSubHubbub) instead of waiting for the next check.
+# The callback URL must be reachable from the internet and forward
+# to push_port on this machine.
+#
+# push_callback_url: "https://example.com/skytube"
+# push_port: 8080
+# push_listen_address: "0.0.0.0"
+
+# =============================================
+# Bluesky Session (Optional)
+# =============================================
+# File used to remember the Bluesky login session between runs,
+# so the script does not have to log in with your password every time.
+# Keep this file private - it grants access to your account.
+#
+# bluesky_session_file: "bluesky_session.txt"
 """
 
+# Accepted answers to the "Create example config?" prompt
+YES_ANSWERS = frozenset({"yes", "y"})
+NO_ANSWERS = frozenset({"no", "n"})
+
+# Placeholder values from EXAMPLE_CONFIG that mean "not filled in yet",
+# per field, so a value is only compared with its own field's placeholder
+CONFIG_PLACEHOLDERS = {
+    "youtube_channel_id": frozenset({"YOUR_CHANNEL_ID_HERE"}),
+    "bluesky_handle": frozenset({"yourhandle.bsky.social"}),
+    "bluesky_password": frozenset({"your-app-password-here"}),
+    "youtube_api_key": frozenset({"YOUR_YOUTUBE_API_KEY_HERE"}),
+}
+
+# XML namespaces used in YouTube's RSS (Atom) feed
+# ElementTree writes tag names as "{namespace}tag"
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+YOUTUBE_NS = "{http://www.youtube.com/xml/schemas/2015}"
+
+# Validators and entries from the last successful RSS fetch
+# Sent back as If-None-Match / If-Modified-Since so YouTube can answer
+# "304 Not Modified" with no body when the feed has not changed
+rss_cache = {
+    "etag": None,
+    "last_modified": None,
+    "entries": [],
+}
+
+# Counts the YouTube API quota units used today
+# Created on first use by get_api_quota()
+api_quota = None
+
+# ETag of the first YouTube API page and the entries from the last
+# complete API fetch. If the first page hasn't changed, the channel has
+# no new uploads, so YouTube can answer "304 Not Modified" and we return
+# the same entries as last time. "key" is the (playlist ID, max results)
+# the entries were fetched for, so a config change never reuses them.
+api_cache = {
+    "etag": None,
+    "key": None,
+    "entries": [],
+}
+
+# Shared HTTP session used for all YouTube requests (RSS, API, thumbnails)
+# Reusing one session keeps connections open between requests, so we
+# don't pay for a new DNS lookup + TCP + TLS handshake every time
+http_session = requests.Session()
+http_session.headers["User-Agent"] = "SkyTube (YouTube to Bluesky Auto-Poster)"
+
+# Retry transient server errors a few times with a short backoff
+# raise_on_status=False returns the last response so our own status
+# code handling still runs when all retries fail
+# Rate limits (429) are not retried here, and Retry-After headers are
+# not honored here: urllib3 would sleep for as long as the server asks,
+# uninterruptibly and spending API quota on hidden retries. Instead the
+# response comes straight back, note_retry_after() remembers the delay
+# and the main loop waits it out (a stop request ends that wait early).
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+))
+
+# Default random variation applied to every sleep between checks (+/- 15%)
+# Keeps many instances from hitting YouTube and Bluesky at the same moment
+# Can be changed with check_interval_jitter in the config
+CHECK_INTERVAL_JITTER = 0.15
+
+# With idle_backoff, after this many check cycles in a row without
+# new videos the sleep between checks starts growing
+IDLE_CHECKS_BEFORE_BACKOFF = 5
+
+# With idle_backoff, each further idle check adds this fraction of
+# check_interval_seconds, so the interval ramps up gradually
+IDLE_BACKOFF_STEP = 0.1
+
+# The sleep between checks never grows beyond this multiple of check_interval_seconds
+MAX_IDLE_BACKOFF_FACTOR = 4
+
+# Number of recent uploads used to work out the average time between uploads
+# for adaptive_check_interval
+UPLOAD_GAP_SAMPLE_SIZE = 10
+
+# Default upper limit for the adaptive check interval (1 day)
+DEFAULT_MAX_CHECK_INTERVAL = 86400
+
+# Average seconds between the channel's recent uploads, worked out from
+# the last fetched feed. None until a feed with 2+ dated videos is seen.
+upload_gap_seconds = None
+
+# Number of new videos found by the last check_for_new_videos() call
+# Used by the main loop to decide whether to back off
+last_check_new_count = 0
+
+# Seconds YouTube asked us to wait (Retry-After header of a 429 response)
+# Set by note_retry_after(), cleared by the main loop once honored
+retry_after_seconds = None
+
+# Thumbnails at or below this size are YouTube placeholders, not real images
+MIN_THUMBNAIL_BYTES = 1000
+
+# Chunk size used when reading thumbnail downloads from the network (64 KB)
+THUMBNAIL_CHUNK_SIZE = 64 * 1024
+
+# Bluesky's maximum post length (in characters)
+MAX_POST_LENGTH = 300
+
+# Most posts per hour we send to Bluesky
+# Bluesky allows 5000 write points per hour and a post costs 3 points
+BLUESKY_POSTS_PER_HOUR = 5000 // 3
+
+# How many posts can go out back to back when several new videos are
+# found at once, before posts are spaced out to BLUESKY_POSTS_PER_HOUR
+POST_BURST = 5
+
+# How many times a Bluesky request is retried after a transient failure
+BLUESKY_MAX_RETRIES = 3
+
+# First wait before retrying a Bluesky request (in seconds)
+# Doubles with each retry, with random jitter so retries don't line up
+BLUESKY_RETRY_BASE_DELAY = 1
+
+# Longest we wait before a single Bluesky retry (in seconds)
+# If Bluesky's rate limit resets later than this, we give up and the
+# post is retried on the next check cycle instead
+BLUESKY_RETRY_MAX_DELAY = 30
+
+# YouTube thumbnail file names, highest quality first
+# maxresdefault: 1280x720 (not always available)
+# hqdefault: 480x360
+# mqdefault: 320x180
+THUMBNAIL_NAMES = ("maxresdefault.jpg", "hqdefault.jpg", "mqdefault.jpg")
+
+# Largest thumbnail size uploaded to Bluesky (needs Pillow)
+# Link cards are shown at most about 600 pixels wide, so the 1280x720
+# maxresdefault image is scaled down to fit this box
+THUMBNAIL_MAX_SIZE = (600, 338)
+
+# WebP quality used when re-encoding a scaled down thumbnail (0-100)
+THUMBNAIL_WEBP_QUALITY = 80
+
+# How many videos' thumbnails prefetch_thumbnails() downloads at once
+# Each video fetches all THUMBNAIL_NAMES in parallel, so this times 3
+# stays within the connection pool of http_session
+THUMBNAIL_PREFETCH_WORKERS = 4
+
+# How long (seconds) an uploaded thumbnail is reused for a failed post
+# The PDS may delete blobs no post refers to after a while, so an older
+# one is uploaded again instead of risking a broken preview
+THUMBNAIL_BLOB_MAX_AGE = 3600
+
+# The WebSub hub YouTube publishes channel upload notifications to
+WEBSUB_HUB_URL = "https://pubsubhubbub.appspot.com/subscribe"
+
+# How long we ask the hub to keep our subscription (5 days)
+WEBSUB_LEASE_SECONDS = 5 * 24 * 60 * 60
+
+# Renew the subscription before the lease runs out (every 4 days)
+WEBSUB_RESUBSCRIBE_SECONDS = 4 * 24 * 60 * 60
+
+# Largest push notification body we accept (1 MB)
+# A notification is a small Atom feed with one entry; anything bigger
+# is refused before reading it, since the signature is checked only after
+MAX_WEBSUB_BODY_BYTES = 1 << 20
+
+# Matches the 11-character video ID in the YouTube URL formats we know:
+#   youtube.com/watch?v=ID (also with other parameters before v=)
+#   youtu.be/ID, youtube.com/shorts/ID, /embed/ID, /live/ID, /v/ID
+#   youtube-nocookie.com/embed/ID
+# The lookahead makes sure the ID isn't just the start of a longer string
+VIDEO_ID_PATTERN = re.compile(
+    r"(?:[?&]vi?=|youtu\.be/|/(?:shorts|embed|live|vi?|e)/)([0-9A-Za-z_-]{11})(?![0-9A-Za-z_-])"
+)
+
+# A bare video ID (when we're given just the ID instead of a URL)
+BARE_VIDEO_ID_PATTERN = re.compile(r"[0-9A-Za-z_-]{11}")
+
+# Config keys a live reload can't apply safely, so they keep their old
+# value until the script is restarted: a new channel would post its whole
+# feed as new videos, the seen videos database is opened once at startup,
+# and the push server and subscription are set up once
+RESTART_REQUIRED_CONFIG_KEYS = (
+    "youtube_channel_id",
+    "seen_videos_db",
+    "seen_videos_file",
+    "push_callback_url",
+    "push_port",
+    "push_listen_address",
+)
+
+# Config keys for the Bluesky login - when one of them changes on a
+# live reload, the logged-in client is dropped and we log in again
+BLUESKY_LOGIN_CONFIG_KEYS = (
+    "bluesky_handle",
+    "bluesky_password",
+    "bluesky_session_file",
+)
+
+# Fields we actually use from the YouTube API playlistItems response
+# Asking for only these (a "partial response") leaves out large values
+# like video descriptions and thumbnail lists, making each page much smaller
+API_PLAYLIST_FIELDS = (
+    "nextPageToken,"
+    "items(snippet(title,publishedAt,resourceId/videoId),contentDetails/videoId)"
+)
+
 # Global config variable that stores the loaded configuration
 # Declared here so all functions can access it
 # Will be populated in main() after loading the config file
 config = {}
 
+# Path and modification time of the loaded config file
+# Used by reload_config_if_changed() to only re-read the file when it changes
+config_path = None
+config_mtime = None
+
+# The post_template split into (literal text, placeholder) pairs
+# Re-parsed only when the template changes (see format_post_text)
+post_template_cache = {
+    "template": None,
+    "parts": None,
+}
+
 # Global variable to track whether to use YouTube API
 # Set by command line argument --use-api
 use_youtube_api = False
@@ -265,12 +764,94 @@ no_cache = False
 # Set by command line argument --dual-mode
 dual_mode = False
 
+# Global variable to track whether to use WebSub push notifications
+# Set by command line argument --push
+push_mode = False
+
+# Video entries received from WebSub push notifications
+# Filled by the callback server thread, consumed by the main loop
+push_queue = queue.Queue()
+
+# Set when the script has been asked to stop (Ctrl+C or SIGTERM)
+stop_event = threading.Event()
+
+# Wakes the main loop up early from its wait between checks
+# Set on a stop request and when a push notification arrives
+wakeup_event = threading.Event()
+
+# Secret shared with the WebSub hub to sign notifications
+# The one of the subscription the hub last confirmed (see do_GET)
+websub_secret = None
+
+# Secret sent with a renewal the hub accepted but hasn't confirmed yet
+# Until it does, the hub may still sign with websub_secret, so
+# notifications signed with either one are accepted
+websub_pending_secret = None
+
+# When this run started (UTC)
+# Pushed videos published before this were already covered by the feed check
+websub_started_at = datetime.now(timezone.utc)
+
+# Open connection to the seen videos database
+# Created on first use by get_seen_db()
+seen_db = None
+
+# The last console timestamp: [whole second, formatted string]
+# Lines printed within the same second reuse the formatted string
+# A list so console_timestamp() can update it in place
+console_timestamp_cache = [None, ""]
+
+# The logged-in Bluesky client, reused for every post
+# Created on first use by get_bluesky_client()
+bluesky_client = None
+
+# Thumbnails already uploaded to Bluesky for videos whose post failed,
+# keyed by video ID, as (blob, time.monotonic() of the upload). When the
+# post is retried on the next check cycle, the blob is reused instead of
+# downloading and uploading it again (see get_cached_thumbnail_blob()).
+# Entries are removed once the post goes through, when it fails for a
+# reason other than a network error or rate limit, and (all of them)
+# when the Bluesky client is reset by reset_bluesky_client().
+thumbnail_blob_cache = {}
+
+# Downloaded thumbnail images not uploaded to Bluesky yet, keyed by video ID
+# Filled by prefetch_thumbnails() for a batch of new videos, and when an
+# upload fails (so the retry only repeats the upload, not the download).
+# Entries are removed once the upload goes through.
+thumbnail_image_cache = {}
+
+# Spaces out posts to stay within Bluesky's rate limits
+# Created on first use by wait_for_post_slot()
+post_bucket = None
+
+# Guards bluesky_client so the warm-up thread started by main() and
+# post_to_bluesky() never log in at the same time
+bluesky_client_lock = threading.Lock()
+
 
 # ============================================================
 # HELPER FUNCTIONS - Reusable pieces of code
 # ============================================================
 
-def log_message(message, color=None):
+def console_timestamp():
+    """
+    Returns the current time formatted for console output.
+    
+    The format only shows whole seconds, so strftime() is only called
+    once per second. Every other line printed in the same second gets
+    the cached string.
+    
+    Returns:
+        The timestamp as "YYYY-MM-DD HH:MM:SS" (e.g., 2026-01-15 18:30:45)
+    """
+    second = int(time.time())
+    if console_timestamp_cache[0] != second:
+        console_timestamp_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        console_timestamp_cache[0] = second
+    return console_timestamp_cache[1]
+
+
+def log_message(message, color=None, level="INFO"):
     """
     Prints a message with a timestamp and optional color.
     Also writes to the log file if --log is enabled.
@@ -278,21 +859,59 @@ def log_message(message, color=None):
     Args:
         message: The text to print
         color: Optional ANSI color code (from Colors class)
+        level: The file log level ("INFO", "SUCCESS", "WARNING", "ERROR")
     """
-    # Get current date/time in a readable format
+    # Get current date/time in a readable format (cached per second)
     # Format: YYYY-MM-DD HH:MM:SS (e.g., 2026-01-15 18:30:45)
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = console_timestamp()
     
-    # If a color was specified, wrap the message with color codes
+    # Build the whole line (color code + message + reset code) as one
+    # string and write it with a single call, instead of print() which
+    # writes the text and the newline separately
+    # Colors are empty strings when output is not a terminal
     if color:
-        # Color code + message + reset code to restore default color
-        print(f"{color}[{timestamp}] {message}{Colors.RESET}")
+        sys.stdout.write(f"{color}[{timestamp}] {message}{Colors.RESET}\n")
     else:
-        # No color, just print the timestamped message
-        print(f"[{timestamp}] {message}")
+        # No color, just write the timestamped message
+        sys.stdout.write(f"[{timestamp}] {message}\n")
+
+    # Write to the file log once, at the level the caller asked for
+    _write_to_file_log(level, message)
+
+
+def print_block(lines):
+    """
+    Prints several lines of text with a single write.
+    
+    Used for the multi-line error banners. Joining the lines first means
+    one write to stdout instead of one per print(), and the banner can't
+    get mixed up with output from another thread.
+    
+    Args:
+        lines: A list of strings, one per line ("" for a blank line)
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
-    # Write to file log as a general INFO message
-    _write_to_file_log("INFO", message)
+def api_key_help_lines():
+    """
+    Returns the instructions for getting a YouTube API key.
+    
+    Built on each call (not a constant) because Colors can be disabled
+    after the module is loaded.
+    
+    Returns:
+        A list of lines for print_block()
+    """
+    return [
+        f"{Colors.YELLOW}  To get a YouTube API key:{Colors.RESET}",
+        f"{Colors.YELLOW}    1. Go to https://console.cloud.google.com/apis/credentials{Colors.RESET}",
+        f"{Colors.YELLOW}    2. Create a new project (or select existing){Colors.RESET}",
+        f"{Colors.YELLOW}    3. Enable the 'YouTube Data API v3'{Colors.RESET}",
+        f"{Colors.YELLOW}    4. Create an API key under 'Credentials'{Colors.RESET}",
+        "",
+    ]
 
 
 def log_error(message):
@@ -301,14 +920,15 @@ def log_error(message):
     Also writes to the log file at ERROR level if --log is enabled.
     Wrapper around log_message for convenience.
     
+    When stdout is a pipe or file (e.g. under systemd), Python buffers
+    it, so normal lines are written out in batches. Errors are flushed
+    straight away so they show up right when they happen.
+    
     Args:
         message: The error text to print
     """
-    log_message(message, Colors.RED)
-    # Additionally write at ERROR level to the file log
-    # (log_message already writes at INFO, so we overwrite with ERROR)
-    # We call _write_to_file_log directly to ensure the ERROR level is used
-    _write_to_file_log("ERROR", message)
+    log_message(message, Colors.RED, "ERROR")
+    sys.stdout.flush()
 
 
 def log_success(message):
@@ -320,9 +940,8 @@ def log_success(message):
     Args:
         message: The success text to print
     """
-    log_message(message, Colors.GREEN)
-    # Write at SUCCESS level to the file log for easy filtering
-    _write_to_file_log("SUCCESS", message)
+    # Logged at SUCCESS level in the file log for easy filtering
+    log_message(message, Colors.GREEN, "SUCCESS")
 
 
 def log_warning(message):
@@ -334,20 +953,26 @@ def log_warning(message):
     Args:
         message: The warning text to print
     """
-    log_message(message, Colors.YELLOW)
-    # Write at WARNING level to the file log
-    _write_to_file_log("WARNING", message)
+    log_message(message, Colors.YELLOW, "WARNING")
 
 
-def log_debug(message):
+def log_debug(fmt, *args):
     """
     Writes a debug-level message to the log file only (not printed to console).
     Useful for verbose diagnostic info that would clutter the terminal.
     
+    Pass values as extra arguments instead of using an f-string, e.g.
+    log_debug("Loaded %s videos", count). The message is then only
+    formatted when file logging is enabled.
+    
     Args:
-        message: The debug text to write to the log file
+        fmt: The debug text to write to the log file, optionally with %s placeholders
+        *args: Values for the placeholders in fmt
     """
-    _write_to_file_log("DEBUG", message)
+    # Cheapest possible exit when debug output is off (no --log)
+    if not debug_log_enabled:
+        return
+    _write_to_file_log("DEBUG", fmt, *args)
 
 
 def log_exception(message, exc):
@@ -364,10 +989,10 @@ def log_exception(message, exc):
     log_error(f"{message}: {exc}")
 
     # Write the full traceback to the log file for detailed debugging
-    # traceback.format_exc() returns the full stack trace as a string
-    tb = traceback.format_exc()
-    if tb and tb.strip() != "NoneType: None":
-        _write_to_file_log("ERROR", f"Full traceback for '{message}':\n{tb}")
+    # logging formats the traceback from exc_info itself, and only
+    # when the record is actually written (i.e. --log is enabled)
+    if exc is not None and exc.__traceback__ is not None:
+        _write_to_file_log("ERROR", "Full traceback for '%s':", message, exc_info=exc)
 
 
 def create_example_config(config_path):
@@ -389,12 +1014,12 @@ def create_example_config(config_path):
         with open(config_path, "w") as f:
             # Write the example configuration template
             f.write(EXAMPLE_CONFIG)
-        log_debug(f"Example config file written to: {config_path}")
+        log_debug("Example config file written to: %s", config_path)
         return True
     except PermissionError:
         # Handle permission errors specifically for a clearer message
         log_error(f"Permission denied: cannot write config file to {config_path}")
-        log_debug(f"Check file/directory permissions for: {config_path}")
+        log_debug("Check file/directory permissions for: %s", config_path)
         return False
     except OSError as e:
         # Handle OS-level errors (disk full, read-only filesystem, etc.)
@@ -406,95 +1031,110 @@ def create_example_config(config_path):
         return False
 
 
-def load_config(config_path):
+def offer_example_config(config_path):
     """
-    Loads configuration from a YAML file.
-    If the file doesn't exist, prompts the user to create an example file.
+    Tells the user the config file is missing and offers to create one.
     
     Args:
-        config_path: Path to the config.yaml file
+        config_path: Path to the config.yaml file that was not found
         
     Returns:
-        Dictionary containing configuration values, or None if config not found
+        None in every case - the script exits so the user can edit
+        the new config (or because they declined to create one)
     """
-    # First, check if the config file exists
-    if not os.path.exists(config_path):
-        # ==========================================
-        # Config file not found - show error prompt
-        # ==========================================
+    log_debug("Config file not found at path: %s", config_path)
+
+    # Display a prominent red error message with a border,
+    # then offer to create an example config file for the user
+    print_block([
+        "",
+        f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}",
+        f"{Colors.RED}{Colors.BOLD}  ERROR: Configuration file not found!{Colors.RESET}",
+        f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}",
+        "",
+        f"{Colors.RED}  Could not find: {config_path}{Colors.RESET}",
+        "",
+        f"{Colors.CYAN}Would you like to create an example configuration file?{Colors.RESET}",
+        f"{Colors.CYAN}This will create: {config_path}{Colors.RESET}",
+        "",
+    ])
+    
+    # Input loop - keep asking until we get a valid yes/no response
+    while True:
+        try:
+            # Get user input, strip whitespace, convert to lowercase
+            response = input(f"{Colors.BOLD}Create example config? (yes/no): {Colors.RESET}").strip().lower()
+        except KeyboardInterrupt:
+            # User pressed Ctrl+C to cancel
+            print()  # New line after ^C
+            log_warning("Cancelled by user")
+            return None
+        except EOFError:
+            # Handle EOF (e.g., piped input ended unexpectedly)
+            print()
+            log_warning("Input stream ended unexpectedly (EOF)")
+            return None
         
-        log_debug(f"Config file not found at path: {config_path}")
-
-        # Display a prominent red error message with a border
-        print()
-        print(f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-        print(f"{Colors.RED}{Colors.BOLD}  ERROR: Configuration file not found!{Colors.RESET}")
-        print(f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-        print()
-        print(f"{Colors.RED}  Could not find: {config_path}{Colors.RESET}")
-        print()
+        # Handle "yes" response
+        if response in YES_ANSWERS:
+            # Try to create the example config file
+            if create_example_config(config_path):
+                # Success! Show instructions for next steps
+                print()
+                log_success(f"Example configuration file created: {config_path}")
+                print_block([
+                    "",
+                    f"{Colors.YELLOW}Please edit the config file with your settings:{Colors.RESET}",
+                    f"{Colors.YELLOW}  1. Add your YouTube channel ID{Colors.RESET}",
+                    f"{Colors.YELLOW}  2. Add your Bluesky handle{Colors.RESET}",
+                    f"{Colors.YELLOW}  3. Add your Bluesky app password{Colors.RESET}",
+                    f"{Colors.YELLOW}  4. (Optional) Add YouTube API key for --use-api mode{Colors.RESET}",
+                    "",
+                    f"{Colors.CYAN}Then run the script again.{Colors.RESET}",
+                ])
+            # Return None to indicate we should exit (user needs to edit config)
+            return None
         
-        # Offer to create an example config file for the user
-        print(f"{Colors.CYAN}Would you like to create an example configuration file?{Colors.RESET}")
-        print(f"{Colors.CYAN}This will create: {config_path}{Colors.RESET}")
-        print()
+        # Handle "no" response
+        elif response in NO_ANSWERS:
+            log_warning("No config file created. Exiting.")
+            return None
         
-        # Input loop - keep asking until we get a valid yes/no response
-        while True:
-            try:
-                # Get user input, strip whitespace, convert to lowercase
-                response = input(f"{Colors.BOLD}Create example config? (yes/no): {Colors.RESET}").strip().lower()
-            except KeyboardInterrupt:
-                # User pressed Ctrl+C to cancel
-                print()  # New line after ^C
-                log_warning("Cancelled by user")
-                return None
-            except EOFError:
-                # Handle EOF (e.g., piped input ended unexpectedly)
-                print()
-                log_warning("Input stream ended unexpectedly (EOF)")
-                return None
-            
-            # Handle "yes" response
-            if response in ["yes", "y"]:
-                # Try to create the example config file
-                if create_example_config(config_path):
-                    # Success! Show instructions for next steps
-                    print()
-                    log_success(f"Example configuration file created: {config_path}")
-                    print()
-                    print(f"{Colors.YELLOW}Please edit the config file with your settings:{Colors.RESET}")
-                    print(f"{Colors.YELLOW}  1. Add your YouTube channel ID{Colors.RESET}")
-                    print(f"{Colors.YELLOW}  2. Add your Bluesky handle{Colors.RESET}")
-                    print(f"{Colors.YELLOW}  3. Add your Bluesky app password{Colors.RESET}")
-                    print(f"{Colors.YELLOW}  4. (Optional) Add YouTube API key for --use-api mode{Colors.RESET}")
-                    print()
-                    print(f"{Colors.CYAN}Then run the script again.{Colors.RESET}")
-                # Return None to indicate we should exit (user needs to edit config)
-                return None
-            
-            # Handle "no" response
-            elif response in ["no", "n"]:
-                log_warning("No config file created. Exiting.")
-                return None
-            
-            # Handle invalid input
-            else:
-                print(f"{Colors.YELLOW}Please enter 'yes' or 'no'{Colors.RESET}")
-    
-    # ==========================================
-    # Config file exists - load and parse it
-    # ==========================================
+        # Handle invalid input
+        else:
+            print(f"{Colors.YELLOW}Please enter 'yes' or 'no'{Colors.RESET}")
+
+
+def load_config(config_path, interactive=True):
+    """
+    Loads configuration from a YAML file.
+    If the file doesn't exist, prompts the user to create an example file.
     
+    Args:
+        config_path: Path to the config.yaml file
+        interactive: Whether a missing file offers to create an example
+            config (False for live reloads, where nobody is at the prompt)
+        
+    Returns:
+        Dictionary containing configuration values, or None if config not found
+    """
     log_message(f"Loading config from: {config_path}")
-    log_debug(f"Config file size: {os.path.getsize(config_path)} bytes")
 
     try:
         # Open file in read mode ("r")
+        # Just try to open it; a missing file is handled below instead of
+        # checking with os.path.exists() first (one system call, not two)
         with open(config_path, "r") as f:
-            # yaml.safe_load parses YAML safely (no code execution)
-            # This is preferred over yaml.load for security
-            user_config = yaml.safe_load(f)
+            # fstat on the open file instead of a separate stat() by path
+            if debug_log_enabled:
+                log_debug("Config file size: %s bytes", os.fstat(f.fileno()).st_size)
+
+            # Parse YAML safely (no code execution) with the safe loader,
+            # reading the whole (small) file in one go
+            # This is the same as yaml.safe_load, but uses libyaml if present
+            # (CSafeLoader; SafeLoader means PyYAML was built without it)
+            log_debug("Parsing config with %s", YamlSafeLoader.__name__)
+            user_config = yaml.load(f.read(), Loader=YamlSafeLoader)
             
             # Handle edge case: empty config file
             if user_config is None:
@@ -505,10 +1145,10 @@ def load_config(config_path):
             # A YAML file could parse to a string or list if malformed
             if not isinstance(user_config, dict):
                 log_error(f"Config file has invalid structure (expected key-value pairs, got {type(user_config).__name__})")
-                log_debug(f"Parsed config type: {type(user_config)}, value: {repr(user_config)[:200]}")
+                log_debug("Parsed config type: %s, value: %s", type(user_config), repr(user_config)[:200])
                 return None
 
-            log_debug(f"Config loaded successfully with {len(user_config)} keys: {list(user_config.keys())}")
+            log_debug("Config loaded successfully with %s keys: %s", len(user_config), list(user_config.keys()))
 
             # Return the parsed configuration dictionary
             return user_config
@@ -520,8 +1160,14 @@ def load_config(config_path):
         if hasattr(e, 'problem_mark') and e.problem_mark is not None:
             mark = e.problem_mark
             log_error(f"  YAML syntax error at line {mark.line + 1}, column {mark.column + 1}")
-        log_debug(f"YAML parsing error details: {repr(e)}")
+        log_debug("YAML parsing error details: %r", e)
         return None
+    # Config file not found - show error prompt
+    except FileNotFoundError:
+        if not interactive:
+            log_warning(f"Config file not found: {config_path}")
+            return None
+        return offer_example_config(config_path)
     # Handle permission errors specifically
     except PermissionError:
         log_error(f"Permission denied: cannot read config file at {config_path}")
@@ -532,6 +1178,24 @@ def load_config(config_path):
         return None
 
 
+def config_value_is_set(field, value):
+    """
+    Checks whether a config value has actually been filled in.
+    
+    Args:
+        field: The config key (e.g. "bluesky_handle")
+        value: The value from the config dictionary (may be None)
+        
+    Returns:
+        True if the value is non-empty and not the EXAMPLE_CONFIG
+        placeholder for that field
+    """
+    if not value:
+        return False
+    # Only strings can be placeholders (and lists can't go in a set lookup)
+    return not (isinstance(value, str) and value in CONFIG_PLACEHOLDERS.get(field, ()))
+
+
 def validate_config(config, require_api_key=False):
     """
     Validates that required configuration values are set.
@@ -548,32 +1212,27 @@ def validate_config(config, require_api_key=False):
     """
     # List of fields that must be set for the script to work
     required_fields = ["youtube_channel_id", "bluesky_handle", "bluesky_password"]
-    
-    # Track which fields are missing or invalid
-    missing = []
-    
-    # Check each required field
-    for field in required_fields:
-        # Get the value, defaulting to empty string if not found
-        value = config.get(field, "")
-        
-        # Check if field is missing, empty, or still has the placeholder value
-        # Placeholder values are from the EXAMPLE_CONFIG template
-        if not value or value in ["YOUR_CHANNEL_ID_HERE", "yourhandle.bsky.social", "your-app-password-here"]:
-            missing.append(field)
-    
-    # If API key is required, check for it
+
+    # If API key is required, check for it too
     if require_api_key:
-        api_key = config.get("youtube_api_key", "")
-        if not api_key or api_key == "YOUR_YOUTUBE_API_KEY_HERE":
-            missing.append("youtube_api_key")
+        required_fields.append("youtube_api_key")
+    
+    # Collect every field that is missing, empty, or still has the
+    # placeholder value from the EXAMPLE_CONFIG template, in one pass
+    missing = [field for field in required_fields if not config_value_is_set(field, config.get(field))]
 
     # Validate check_interval_seconds is a positive number if present
     check_interval = config.get("check_interval_seconds")
     if check_interval is not None:
         if not isinstance(check_interval, (int, float)) or check_interval <= 0:
             log_warning(f"Invalid check_interval_seconds value: {check_interval} (must be a positive number, using default 600)")
-            log_debug(f"check_interval_seconds type: {type(check_interval).__name__}, value: {repr(check_interval)}")
+            log_debug("check_interval_seconds type: %s, value: %r", type(check_interval).__name__, check_interval)
+
+    # Validate check_interval_jitter is a fraction between 0 and 1 if present
+    jitter = config.get("check_interval_jitter")
+    if jitter is not None:
+        if not isinstance(jitter, (int, float)) or not 0 <= jitter < 1:
+            log_warning(f"Invalid check_interval_jitter value: {jitter} (must be at least 0 and below 1, using default {CHECK_INTERVAL_JITTER})")
 
     # Validate api_max_results is within the acceptable range if present
     max_results = config.get("api_max_results")
@@ -584,27 +1243,25 @@ def validate_config(config, require_api_key=False):
     # If any fields are missing, show an error and return False
     if missing:
         # Display a prominent error message
-        print()
-        print(f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-        print(f"{Colors.RED}{Colors.BOLD}  ERROR: Missing or invalid configuration!{Colors.RESET}")
-        print(f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-        print()
-        print(f"{Colors.RED}  Please set the following values in your config file:{Colors.RESET}")
+        lines = [
+            "",
+            f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}",
+            f"{Colors.RED}{Colors.BOLD}  ERROR: Missing or invalid configuration!{Colors.RESET}",
+            f"{Colors.RED}{Colors.BOLD}{'=' * 60}{Colors.RESET}",
+            "",
+            f"{Colors.RED}  Please set the following values in your config file:{Colors.RESET}",
+        ]
         # List each missing field
-        for field in missing:
-            print(f"{Colors.RED}    - {field}{Colors.RESET}")
-        print()
+        lines.extend(f"{Colors.RED}    - {field}{Colors.RESET}" for field in missing)
+        lines.append("")
 
-        log_debug(f"Config validation failed. Missing fields: {missing}")
-        
         # If API key is missing, provide additional help
         if "youtube_api_key" in missing:
-            print(f"{Colors.YELLOW}  To get a YouTube API key:{Colors.RESET}")
-            print(f"{Colors.YELLOW}    1. Go to https://console.cloud.google.com/apis/credentials{Colors.RESET}")
-            print(f"{Colors.YELLOW}    2. Create a new project (or select existing){Colors.RESET}")
-            print(f"{Colors.YELLOW}    3. Enable the 'YouTube Data API v3'{Colors.RESET}")
-            print(f"{Colors.YELLOW}    4. Create an API key under 'Credentials'{Colors.RESET}")
-            print()
+            lines.extend(api_key_help_lines())
+
+        print_block(lines)
+
+        log_debug("Config validation failed. Missing fields: %s", missing)
         
         return False
     
@@ -613,180 +1270,694 @@ def validate_config(config, require_api_key=False):
     return True
 
 
-def load_seen_videos():
+def reload_config_if_changed():
     """
-    Loads the list of video IDs we've already posted about.
-    This data is stored in a JSON file so it survives restarts.
+    Re-reads the config file if it was modified since it was loaded.
     
-    Returns:
-        A set of video ID strings we've already seen
-    """
-    # Get the path to the seen videos file from config
-    # Default to "youtube_bluesky_seen.json" if not specified
-    seen_file = config.get("seen_videos_file", "youtube_bluesky_seen.json")
+    Only a single os.stat() is done per check cycle. The YAML file is
+    parsed again only when its modification time changed, so config
+    edits take effect without restarting the script.
     
-    # Check if the file exists
-    if os.path.exists(seen_file):
-        try:
-            # Open and read the file
-            with open(seen_file, "r") as f:
-                # json.load converts JSON text back to Python data
-                # We convert the list to a set for faster lookups
-                data = json.load(f)
-
-                # Validate that the loaded data is actually a list
-                if not isinstance(data, list):
-                    log_warning(f"Seen videos file has unexpected format (expected list, got {type(data).__name__}). Starting fresh.")
-                    log_debug(f"Unexpected seen_videos data type: {type(data)}, value preview: {repr(data)[:200]}")
-                    return set()
-
-                log_debug(f"Loaded {len(data)} seen video IDs from {seen_file}")
-                return set(data)
-
-        except json.JSONDecodeError as e:
-            # Handle corrupted or invalid JSON in the seen videos file
-            log_error(f"Seen videos file is corrupted (invalid JSON): {e}")
-            log_debug(f"JSON decode error in {seen_file}: {repr(e)}")
-
-            # Attempt to back up the corrupted file before starting fresh
-            backup_path = seen_file + ".corrupt.bak"
-            try:
-                os.rename(seen_file, backup_path)
-                log_warning(f"Corrupted file backed up to: {backup_path}")
-            except OSError as rename_err:
-                log_warning(f"Could not back up corrupted file: {rename_err}")
+    Changes to RESTART_REQUIRED_CONFIG_KEYS are not applied (with a
+    warning) and those keys keep their old values. A change to the
+    Bluesky login resets the client, so the next post logs in again.
+    
+    If the new config cannot be loaded or is invalid (or the file was
+    removed in the meantime), the previous config is kept.
+    """
+    global config
+    global config_mtime
+
+    try:
+        mtime = os.stat(config_path).st_mtime
+    except OSError as e:
+        # File was removed or is unreadable - keep using the loaded config
+        log_debug("Could not stat config file %s: %r", config_path, e)
+        return
 
-            return set()
+    # Nothing changed since the last load
+    if mtime == config_mtime:
+        return
 
-        except PermissionError:
-            # Handle permission errors reading the seen videos file
-            log_error(f"Permission denied: cannot read seen videos file at {seen_file}")
-            return set()
+    # Remember this version even if it turns out invalid,
+    # so we don't retry (and warn) on every cycle until it is edited again
+    config_mtime = mtime
 
-        except Exception as e:
-            # Handle any other unexpected errors reading the file
-            log_exception(f"Unexpected error loading seen videos from {seen_file}", e)
-            return set()
-    else:
-        # No file yet - this is a fresh start, return empty set
-        log_debug(f"Seen videos file not found at {seen_file}, starting with empty set")
-        return set()
+    log_message("Config file changed, reloading...", Colors.CYAN)
+    new_config = load_config(config_path, interactive=False)
+    if new_config is None or not validate_config(new_config, require_api_key=(use_youtube_api or dual_mode)):
+        log_warning("Reloaded config is invalid, keeping the previous configuration")
+        return
 
+    # Keep the old values of settings that need a restart
+    for key in RESTART_REQUIRED_CONFIG_KEYS:
+        if new_config.get(key) == config.get(key):
+            continue
+        log_warning(f"{key} changed - restart the script to apply it, keeping the old value until then")
+        if key in config:
+            new_config[key] = config[key]
+        else:
+            del new_config[key]
+
+    # Different Bluesky account or session file - log in again on the next post
+    login_changed = any(new_config.get(key) != config.get(key) for key in BLUESKY_LOGIN_CONFIG_KEYS)
+
+    config = new_config
+    if login_changed:
+        log_message("Bluesky login changed, will log in again on the next post", Colors.CYAN)
+        reset_bluesky_client()
+    log_success("Config reloaded")
 
-def save_seen_videos(seen_videos):
+
+def load_legacy_seen_videos(seen_file):
     """
-    Saves the list of seen video IDs to a file.
+    Loads video IDs from the JSON seen videos file used by older versions.
     
-    This persists the data so the script remembers which videos
-    have already been posted, even after restarts.
+    Only used to import the old file into the SQLite database.
     
     Args:
-        seen_videos: A set of video ID strings
-    """
-    # Get the path to the seen videos file from config
-    seen_file = config.get("seen_videos_file", "youtube_bluesky_seen.json")
+        seen_file: Path to the JSON file (a list of video IDs)
     
+    Returns:
+        A set of video ID strings (empty if the file is missing or invalid)
+    """
+    # Just try to open the file; a missing file means there is nothing to import
     try:
-        # Open file for writing (creates it if it doesn't exist)
-        with open(seen_file, "w") as f:
-            # Convert set to list (JSON doesn't support sets)
-            # then write it to the file
-            json.dump(list(seen_videos), f)
-        log_debug(f"Saved {len(seen_videos)} seen video IDs to {seen_file}")
+        # Open and read the file
+        with open(seen_file, "rb") as f:
+            # json_loads converts JSON text back to Python data
+            data = json_loads(f.read())
+
+            # Validate that the loaded data is actually a list
+            if not isinstance(data, list):
+                log_warning(f"Seen videos file has unexpected format (expected list, got {type(data).__name__}). Skipping import.")
+                log_debug("Unexpected seen_videos data type: %s, value preview: %s", type(data), repr(data)[:200])
+                return set()
+
+            log_debug("Loaded %s seen video IDs from %s", len(data), seen_file)
+            return set(data)
+
+    except FileNotFoundError:
+        # No old file - nothing to import
+        log_debug("Seen videos file not found at %s, nothing to import", seen_file)
+        return set()
 
-    except PermissionError:
-        # Handle permission errors writing the seen videos file
-        log_error(f"Permission denied: cannot write seen videos file to {seen_file}")
-        log_error("Video tracking may be lost — duplicate posts could occur on next run!")
+    except json.JSONDecodeError as e:
+        # Handle corrupted or invalid JSON in the seen videos file
+        log_error(f"Seen videos file is corrupted (invalid JSON): {e}")
+        log_debug("JSON decode error in %s: %r", seen_file, e)
 
-    except OSError as e:
-        # Handle OS-level errors (disk full, read-only filesystem, etc.)
-        log_exception(f"OS error writing seen videos file to {seen_file}", e)
-        log_error("Video tracking may be lost — duplicate posts could occur on next run!")
+        # Attempt to back up the corrupted file before starting fresh
+        backup_path = seen_file + ".corrupt.bak"
+        try:
+            os.rename(seen_file, backup_path)
+            log_warning(f"Corrupted file backed up to: {backup_path}")
+        except OSError as rename_err:
+            log_warning(f"Could not back up corrupted file: {rename_err}")
+
+        return set()
+
+    except PermissionError:
+        # Handle permission errors reading the seen videos file
+        log_error(f"Permission denied: cannot read seen videos file at {seen_file}")
+        return set()
 
     except Exception as e:
-        # Handle any other unexpected errors
-        log_exception(f"Unexpected error saving seen videos to {seen_file}", e)
-        log_error("Video tracking may be lost — duplicate posts could occur on next run!")
+        # Handle any other unexpected errors reading the file
+        log_exception(f"Unexpected error loading seen videos from {seen_file}", e)
+        return set()
 
 
-def get_youtube_feed():
+def get_seen_db():
     """
-    Fetches and parses the YouTube channel's RSS feed.
+    Returns the connection to the seen videos database, opening it on first use.
     
-    YouTube provides RSS feeds for every channel at a predictable URL.
-    This function fetches the feed and parses it into a list of video entries.
+    The database has a single table with one row per seen video, so
+    recording a new video is one INSERT instead of rewriting a file with
+    every video ever seen. WAL journaling keeps it safe if the script is
+    killed in the middle of a write.
+    
+    The database path is seen_videos_db from config, or seen_videos_file
+    with a .db extension. If the database is empty and the old JSON
+    seen_videos_file exists, its video IDs are imported.
     
     Returns:
-        A list of video entries from the feed, or empty list on error
+        An sqlite3.Connection, or None if the database could not be opened
     """
-    # Get the YouTube channel ID from config
-    channel_id = config.get("youtube_channel_id", "")
-    
-    # Construct the RSS feed URL
-    # YouTube provides RSS feeds at this URL format
-    feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-    
-    log_message(f"Fetching RSS feed: {feed_url}")
-    log_debug(f"RSS fetch initiated for channel: {channel_id}")
-    
+    global seen_db
+
+    # Reuse the already open connection
+    if seen_db is not None:
+        return seen_db
+
+    seen_file = config.get("seen_videos_file", "youtube_bluesky_seen.json")
+    db_path = config.get("seen_videos_db") or os.path.splitext(seen_file)[0] + ".db"
+
     try:
-        # Use feedparser to fetch and parse the RSS/Atom feed
-        # feedparser handles all the complexity of parsing different feed formats
-        feed = feedparser.parse(feed_url)
-    except Exception as e:
-        # Handle unexpected errors from feedparser (network issues, malformed XML, etc.)
-        log_exception("Failed to fetch or parse RSS feed", e)
-        return []
-    
-    # Check if parsing was successful
-    # 'bozo' is True if there was a parsing error (feedparser terminology)
-    if feed.bozo:
-        log_warning(f"Feed parsing issue - {feed.bozo_exception}")
-        log_debug(f"Feed bozo exception type: {type(feed.bozo_exception).__name__}")
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY, ts INTEGER)")
+        conn.commit()
+        log_debug("Opened seen videos database: %s", db_path)
+
+        # One-time import of the JSON file used by older versions
+        if conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 0:
+            legacy_ids = load_legacy_seen_videos(seen_file)
+            if legacy_ids:
+                now = int(time.time())
+                # "with conn" commits the whole import as one transaction
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO seen (id, ts) VALUES (?, ?)",
+                        ((video_id, now) for video_id in legacy_ids)
+                    )
+                log_message(f"Imported {len(legacy_ids)} seen videos from {seen_file} into {db_path}")
+
+    except sqlite3.Error as e:
+        log_exception(f"Could not open seen videos database at {db_path}", e)
+        log_error("Video tracking may be lost — duplicate posts could occur on next run!")
+        return None
 
-    # Check if the feed returned any entries at all
-    if not feed.entries:
-        log_warning("RSS feed returned no entries")
-        # Log HTTP status if available (feedparser stores it in feed.status)
-        if hasattr(feed, 'status'):
-            log_debug(f"RSS feed HTTP status: {feed.status}")
-        # Check if the feed itself has a title (indicates the channel was found)
-        if hasattr(feed.feed, 'title'):
-            log_debug(f"Feed title: {feed.feed.title}")
-        else:
-            log_warning("Feed has no title — channel ID may be invalid or the channel has no public videos")
-        return []
+    # Close the database cleanly on exit
+    atexit.register(conn.close)
 
-    log_debug(f"RSS feed returned {len(feed.entries)} entries")
-    
-    # Return the list of video entries
-    # Each entry contains: title, link, id, published date, etc.
-    return feed.entries
+    seen_db = conn
+    return conn
 
 
-def get_youtube_feed_api():
+def load_seen_videos():
     """
-    Fetches videos using the YouTube Data API instead of RSS.
-    
-    This function uses the YouTube Data API v3 to fetch the channel's
-    uploaded videos. This method is more reliable than RSS and provides
-    more detailed information, but requires an API key.
-    
-    The uploads playlist ID is derived from the channel ID by replacing
-    the "UC" prefix with "UU".
-    
-    Uses pagination to fetch more than 50 videos when api_max_results
-    is set higher than 50 in the config.
+    Loads the list of video IDs we've already posted about.
+    This data is stored in an SQLite database so it survives restarts.
     
     Returns:
-        A list of video entries (same format as RSS for compatibility),
-        or empty list on error
+        A set of video ID strings we've already seen
     """
-    # Get configuration values
-    channel_id = config.get("youtube_channel_id", "")
-    api_key = config.get("youtube_api_key", "")
-    max_results = config.get("api_max_results", 15)
+    conn = get_seen_db()
+    if conn is None:
+        return set()
+
+    try:
+        # We keep the IDs in a set for fast lookups while checking feeds
+        seen_videos = {row[0] for row in conn.execute("SELECT id FROM seen")}
+        log_debug("Loaded %s seen video IDs from database", len(seen_videos))
+        return seen_videos
+    except sqlite3.Error as e:
+        log_exception("Unexpected error loading seen videos from database", e)
+        return set()
+
+
+def add_seen_videos(video_ids):
+    """
+    Records video IDs as seen in the database.
+    
+    Only the given IDs are written (INSERT OR IGNORE), so the cost does
+    not grow with the number of videos already in the database.
+    
+    Args:
+        video_ids: An iterable of video ID strings
+    """
+    conn = get_seen_db()
+    if conn is None:
+        log_error("Seen videos database is not available — cannot record videos")
+        log_error("Video tracking may be lost — duplicate posts could occur on next run!")
+        return
+
+    now = int(time.time())
+    try:
+        # "with conn" commits on success and rolls back on error
+        with conn:
+            cursor = conn.executemany(
+                "INSERT OR IGNORE INTO seen (id, ts) VALUES (?, ?)",
+                ((video_id, now) for video_id in video_ids)
+            )
+        log_debug("Recorded %s new seen video IDs in database", cursor.rowcount)
+
+    except sqlite3.Error as e:
+        # Handle database errors (disk full, locked, read-only filesystem, etc.)
+        log_exception("Database error recording seen videos", e)
+        log_error("Video tracking may be lost — duplicate posts could occur on next run!")
+
+
+class TokenBucket:
+    """
+    A token bucket that spaces out requests to a steady rate.
+    
+    Tokens refill at rate_per_second, up to capacity. Each request takes
+    its cost in tokens first, and only waits when the bucket is empty,
+    so up to capacity requests can go out back to back.
+    
+    Used to pace Bluesky posts (see wait_for_post_slot()).
+    """
+
+    def __init__(self, rate_per_second, capacity):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cost=1):
+        """
+        Takes cost tokens from the bucket, waiting until enough have refilled.
+        
+        The lock is only held while the tokens are counted, not during the
+        wait, so other threads aren't blocked behind a sleeping one.
+        
+        Returns:
+            True once the tokens were taken, False if the script was asked
+            to stop while waiting (no tokens are taken then)
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return True
+
+                # Not enough tokens - work out how long the shortfall takes to refill
+                wait = (cost - self.tokens) / self.rate
+
+            # Wait outside the lock, unless a stop request comes in first,
+            # then check again (another thread may have taken tokens meanwhile)
+            log_debug("Token bucket empty, waiting %.1f seconds", wait)
+            if stop_event.wait(wait):
+                return False
+
+
+def get_quota_day():
+    """
+    Returns today's date in US Pacific time.
+    
+    The YouTube API quota resets at midnight Pacific time. If the time
+    zone database is missing (e.g. Windows without the tzdata package),
+    Pacific standard time (UTC-8) is used, which is at most an hour off.
+    """
+    try:
+        pacific = ZoneInfo("America/Los_Angeles")
+    except ZoneInfoNotFoundError:
+        pacific = timezone(timedelta(hours=-8))
+    return datetime.now(pacific).date()
+
+
+class DailyQuota:
+    """
+    Keeps track of the YouTube API quota units used per day.
+    
+    The API quota is a daily budget rather than a rate: all of it may be
+    used at once, and it resets at midnight Pacific time. So requests
+    never wait - a multi-page --build-db run goes through at full speed -
+    and only stop once today's budget is spent.
+    
+    The count is kept in memory, so it starts over when the script is
+    restarted.
+    """
+
+    def __init__(self, quota_per_day):
+        self.quota_per_day = quota_per_day
+        self.day = None
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def acquire(self, cost=1):
+        """
+        Takes cost units from today's budget.
+        
+        Returns:
+            True if the units fit in today's budget, False if it is spent
+        """
+        with self.lock:
+            # A new quota day - start counting again
+            today = get_quota_day()
+            if today != self.day:
+                self.day = today
+                self.used = 0
+
+            if self.used + cost > self.quota_per_day:
+                return False
+
+            self.used += cost
+            return True
+
+
+def get_api_quota():
+    """
+    Returns the DailyQuota for YouTube API requests.
+    
+    Created on first use from youtube_api_quota_per_day (default 10000).
+    If that setting is changed in the config, the limit is updated and
+    the units already used today are kept.
+    
+    Returns:
+        The shared DailyQuota instance
+    """
+    global api_quota
+
+    quota = config.get("youtube_api_quota_per_day", 10000)
+    if not isinstance(quota, (int, float)) or quota <= 0:
+        log_warning(f"Invalid youtube_api_quota_per_day ({quota}), using default 10000")
+        quota = 10000
+
+    if api_quota is None:
+        api_quota = DailyQuota(quota)
+    api_quota.quota_per_day = quota
+    return api_quota
+
+
+def note_retry_after(response):
+    """
+    Remembers the Retry-After header of a rate-limited (HTTP 429) response.
+    
+    The main loop then waits at least that long before the next check.
+    Retry-After can be a number of seconds or an HTTP date.
+    
+    Args:
+        response: The requests.Response that was rate limited
+    """
+    global retry_after_seconds
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        # Not a number - try the HTTP date format
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            log_debug("Could not parse Retry-After header: %r", value)
+            return
+
+    retry_after_seconds = max(0, seconds)
+    log_warning(f"Server asked us to wait {int(retry_after_seconds)} seconds before retrying")
+
+
+def get_sleep_interval(check_interval, idle_checks):
+    """
+    Works out how long to sleep before the next check.
+    
+    - After IDLE_CHECKS_BEFORE_BACKOFF checks in a row without new videos,
+      the interval grows by IDLE_BACKOFF_STEP with each idle check, up to
+      MAX_IDLE_BACKOFF_FACTOR times check_interval. It drops back as soon
+      as a new video is found. Pass 0 for idle_checks to turn this off.
+    - A random +/- check_interval_jitter (default CHECK_INTERVAL_JITTER)
+      is applied so that many instances do not all poll at the same moment.
+    - If YouTube sent a Retry-After, we wait at least that long.
+    
+    Args:
+        check_interval: The configured check_interval_seconds
+        idle_checks: Number of check cycles in a row without new videos
+        
+    Returns:
+        The number of seconds to sleep
+    """
+    global retry_after_seconds
+
+    interval = check_interval
+    if idle_checks > IDLE_CHECKS_BEFORE_BACKOFF:
+        extra_checks = idle_checks - IDLE_CHECKS_BEFORE_BACKOFF
+        interval *= min(MAX_IDLE_BACKOFF_FACTOR, 1 + extra_checks * IDLE_BACKOFF_STEP)
+
+    # Jitter must leave the interval positive, so it has to stay below 1
+    jitter = config.get("check_interval_jitter", CHECK_INTERVAL_JITTER)
+    if not isinstance(jitter, (int, float)) or not 0 <= jitter < 1:
+        jitter = CHECK_INTERVAL_JITTER
+    interval *= random.uniform(1 - jitter, 1 + jitter)
+
+    # Honor a pending Retry-After (only once)
+    if retry_after_seconds is not None:
+        interval = max(interval, retry_after_seconds)
+        retry_after_seconds = None
+
+    return interval
+
+
+def parse_published_date(published):
+    """
+    Parses a video's published date from the feed or the API.
+    
+    RSS dates look like 2024-01-31T12:00:00+00:00, API dates end in "Z".
+    
+    Args:
+        published: The date string (may be empty)
+        
+    Returns:
+        A timezone-aware datetime, or None if the date is missing or invalid
+    """
+    if not published:
+        return None
+    try:
+        # fromisoformat only understands "Z" from Python 3.11 on
+        date = datetime.fromisoformat(published.replace("Z", "+00:00"))
+    except ValueError:
+        log_debug("Could not parse published date: %s", published)
+        return None
+
+    # Treat dates without an offset as UTC so they can be compared
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
+
+
+def get_upload_gap(entries):
+    """
+    Works out the average time between the channel's recent uploads.
+    
+    Uses the published dates of the newest UPLOAD_GAP_SAMPLE_SIZE entries.
+    
+    Args:
+        entries: List of video entries from the feed
+        
+    Returns:
+        The average gap in seconds, or None if fewer than 2 dates could be read
+    """
+    dates = []
+    for entry in entries:
+        published = parse_published_date(entry.get("published", ""))
+        if published is not None:
+            dates.append(published)
+
+    dates = sorted(dates, reverse=True)[:UPLOAD_GAP_SAMPLE_SIZE]
+    if len(dates) < 2:
+        return None
+
+    # Newest minus oldest, spread over the gaps between them
+    return (dates[0] - dates[-1]).total_seconds() / (len(dates) - 1)
+
+
+def get_adaptive_interval(check_interval):
+    """
+    Works out the check interval for adaptive_check_interval.
+    
+    Checking twice per average upload gap keeps the delay for a new video
+    at a fraction of how long the channel usually goes between uploads,
+    without polling a channel that uploads weekly every few minutes.
+    
+    Args:
+        check_interval: The configured check_interval_seconds (the minimum)
+        
+    Returns:
+        The interval in seconds, between check_interval and max_check_interval_seconds
+    """
+    max_interval = config.get("max_check_interval_seconds", DEFAULT_MAX_CHECK_INTERVAL)
+    if not isinstance(max_interval, (int, float)) or max_interval <= 0:
+        max_interval = DEFAULT_MAX_CHECK_INTERVAL
+
+    # No upload history yet - stick to the configured interval
+    if upload_gap_seconds is None:
+        return check_interval
+
+    return max(check_interval, min(upload_gap_seconds / 2, max_interval))
+
+
+def iter_feed_entries(source):
+    """
+    Parses video entries out of a YouTube Atom feed.
+    
+    Uses ElementTree's iterparse, so entries are produced while the feed
+    is still being read, and only the fields we need (video ID, title,
+    link and published date) are extracted from each <entry>.
+    
+    Used for both the RSS feed and WebSub push notifications, which
+    share the same format.
+    
+    Args:
+        source: A binary file-like object with the feed XML
+        
+    Yields:
+        One dict per <entry>, with the same keys as the API entries
+        
+    Raises:
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
+    # Only look at closing tags - by then the element is complete
+    for event, elem in ET.iterparse(source, events=("end",)):
+        if elem.tag != ATOM_NS + "entry":
+            continue
+
+        video_id = elem.findtext(YOUTUBE_NS + "videoId", "")
+        link = elem.find(ATOM_NS + "link")
+
+        # Build an entry with the same keys as the API entries
+        yield {
+            "yt_videoid": video_id,
+            "id": video_id,
+            "title": elem.findtext(ATOM_NS + "title", "Unknown Title"),
+            "link": link.get("href", "") if link is not None else "",
+            "published": elem.findtext(ATOM_NS + "published", ""),
+        }
+
+        # Free the parsed entry to keep memory use flat
+        elem.clear()
+
+
+def get_youtube_feed():
+    """
+    Fetches and parses the YouTube channel's RSS feed.
+    
+    YouTube provides RSS feeds for every channel at a predictable URL.
+    This function fetches the feed and parses it into a list of video entries.
+    
+    The feed is parsed while it is being downloaded (see iter_feed_entries).
+    
+    The request is a conditional GET using the ETag / Last-Modified of the
+    previous fetch. If YouTube answers 304 Not Modified, the entries from
+    the previous fetch are returned without downloading or parsing
+    anything. Disabled by --no-cache.
+    
+    Returns:
+        A list of video entries from the feed, or empty list on error
+    """
+    # Get the YouTube channel ID from config
+    channel_id = config.get("youtube_channel_id", "")
+    
+    # Construct the RSS feed URL
+    # YouTube provides RSS feeds at this URL format
+    feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+    
+    log_message(f"Fetching RSS feed: {feed_url}")
+    log_debug("RSS fetch initiated for channel: %s", channel_id)
+
+    # List to store the parsed video entries
+    entries = []
+
+    # Set if the XML could only be partly parsed
+    parse_failed = False
+
+    # Ask YouTube to only send the feed if it changed since the last fetch
+    request_headers = {}
+    if not no_cache:
+        if rss_cache["etag"]:
+            request_headers["If-None-Match"] = rss_cache["etag"]
+        if rss_cache["last_modified"]:
+            request_headers["If-Modified-Since"] = rss_cache["last_modified"]
+    
+    try:
+        # stream=True lets us parse the feed while it is still downloading
+        with http_session.get(feed_url, headers=request_headers, stream=True, timeout=30) as response:
+            log_debug("RSS feed HTTP status: %s", response.status_code)
+
+            # Feed has not changed - reuse the entries from the last fetch
+            if response.status_code == 304:
+                log_message("RSS feed not modified since last check")
+                return list(rss_cache["entries"])
+
+            # Rate limited - remember how long YouTube wants us to wait
+            if response.status_code == 429:
+                log_warning("YouTube RSS rate limit hit (HTTP 429). Waiting before retrying...")
+                note_retry_after(response)
+                return []
+
+            # YouTube returns 404 for unknown channel IDs
+            if response.status_code == 404:
+                log_error(f"RSS feed not found (HTTP 404). Check that channel ID '{channel_id}' is correct")
+                return []
+            response.raise_for_status()
+
+            # Let urllib3 undo any gzip compression while we read the raw stream
+            response.raw.decode_content = True
+
+            # Parse entries while the feed is downloading
+            for entry in iter_feed_entries(response.raw):
+                entries.append(entry)
+
+    except ET.ParseError as e:
+        # Malformed XML - keep whatever entries were parsed before the error
+        log_warning(f"Feed parsing issue - {e}")
+        parse_failed = True
+        log_debug("Parsed %s entries before the parse error", len(entries))
+    except requests.exceptions.Timeout:
+        log_error("RSS feed request timed out after 30 seconds")
+        return []
+    except requests.exceptions.RequestException as e:
+        # Handle network issues and HTTP errors (5xx, etc.)
+        log_exception("Failed to fetch RSS feed", e)
+        return []
+    except Exception as e:
+        # Handle any other unexpected errors while parsing the feed
+        log_exception("Failed to fetch or parse RSS feed", e)
+        return []
+
+    # Check if the feed returned any entries at all
+    if not entries:
+        log_warning("RSS feed returned no entries — the channel may have no public videos")
+        return []
+
+    log_debug("RSS feed returned %s entries", len(entries))
+
+    # Remember the validators for the next conditional GET
+    # (only for complete, successfully parsed feeds)
+    if not parse_failed:
+        rss_cache["etag"] = response.headers.get("ETag")
+        rss_cache["last_modified"] = response.headers.get("Last-Modified")
+        rss_cache["entries"] = entries
+    
+    # Return the list of video entries
+    # Each entry contains: title, link, id, published date
+    return entries
+
+
+def get_youtube_feed_api(seen_videos=None):
+    """
+    Fetches videos using the YouTube Data API instead of RSS.
+    
+    This function uses the YouTube Data API v3 to fetch the channel's
+    uploaded videos. This method is more reliable than RSS and provides
+    more detailed information, but requires an API key.
+    
+    The uploads playlist ID is derived from the channel ID by replacing
+    the "UC" prefix with "UU", so no extra API call is needed to look it up.
+    Each page is a single playlistItems request (1 quota unit for up to 50
+    videos) asking only for the fields in API_PLAYLIST_FIELDS.
+    
+    Uses pagination to fetch more than 50 videos when api_max_results
+    is set higher than 50 in the config. The uploads playlist is sorted
+    newest first, so once a page contains a video from seen_videos, every
+    later page holds only older videos and is not requested.
+    
+    The first page is requested with If-None-Match using the ETag from
+    the last complete fetch (see api_cache), unless --no-cache is set.
+    A 304 answer means nothing was uploaded since, and the previous
+    entries are returned without fetching any more pages.
+    
+    Args:
+        seen_videos: Optional set of video IDs already posted. When given,
+                     pagination stops at the first page that reaches them.
+                     Left out by --build-db, which wants the full list.
+    
+    Returns:
+        A list of video entries (same format as RSS for compatibility),
+        or empty list on error
+    """
+    # Get configuration values
+    channel_id = config.get("youtube_channel_id", "")
+    api_key = config.get("youtube_api_key", "")
+    max_results = config.get("api_max_results", 15)
     
     # Validate we have an API key
     if not api_key:
@@ -819,9 +1990,39 @@ def get_youtube_feed_api():
 
     # Counter for API pages fetched (useful for debugging pagination issues)
     page_count = 0
+
+    # ETag of the first page, saved in api_cache once the fetch completes
+    first_page_etag = None
+
+    # Entries in api_cache can only be reused for the same playlist and size
+    cache_key = (uploads_playlist_id, max_results)
     
     # API endpoint URL
     url = "https://www.googleapis.com/youtube/v3/playlistItems"
+
+    # Build the API request parameters once; only maxResults and
+    # pageToken change from page to page
+    params = {
+        "part": "snippet,contentDetails",
+        "fields": API_PLAYLIST_FIELDS,
+        "playlistId": uploads_playlist_id,
+        "maxResults": 50,
+        "key": api_key
+    }
+
+    # Headers are the same for every page
+    request_headers = {}
+
+    # Add cache-busting if --no-cache flag is enabled
+    if no_cache:
+        # Add cache-control headers to prevent caching
+        request_headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+        request_headers["Pragma"] = "no-cache"
+        request_headers["Expires"] = "0"
+        # Add a unique timestamp parameter to bust caches
+        # One value per check is enough, every page of it wants fresh data
+        params["_nocache"] = str(int(time.time()))
+        log_debug("Cache-busting enabled: added timestamp %s", params['_nocache'])
     
     try:
         # Loop to handle pagination
@@ -833,13 +2034,7 @@ def get_youtube_feed_api():
             # API maximum per request is 50
             per_page = min(remaining, 50)
             
-            # Build the API request parameters
-            params = {
-                "part": "snippet,contentDetails",
-                "playlistId": uploads_playlist_id,
-                "maxResults": per_page,
-                "key": api_key
-            }
+            params["maxResults"] = per_page
             
             # Add page token if we're fetching subsequent pages
             if next_page_token:
@@ -847,25 +2042,29 @@ def get_youtube_feed_api():
                 log_message(f"Fetching next page of results...")
 
             page_count += 1
-            log_debug(f"API request page {page_count}: maxResults={per_page}, pageToken={next_page_token}")
+            log_debug("API request page %s: maxResults=%s, pageToken=%s", page_count, per_page, next_page_token)
+
 
-            # Prepare headers and parameters for the API request
-            request_headers = {}
+            # Only ask for the first page if it changed since the last fetch
+            page_headers = request_headers
+            if page_count == 1 and not no_cache and api_cache["etag"] and api_cache["key"] == cache_key:
+                page_headers = dict(request_headers, **{"If-None-Match": api_cache["etag"]})
 
-            # Add cache-busting if --no-cache flag is enabled
-            if no_cache:
-                # Add cache-control headers to prevent caching
-                request_headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-                request_headers["Pragma"] = "no-cache"
-                request_headers["Expires"] = "0"
-                # Add a unique timestamp parameter to bust caches
-                params["_nocache"] = str(int(time.time()))
-                log_debug(f"Cache-busting enabled: added timestamp {params['_nocache']}")
+            # Each playlistItems page costs 1 quota unit
+            if not get_api_quota().acquire(1):
+                log_warning("Daily YouTube API quota (youtube_api_quota_per_day) is used up, "
+                            "no more API requests until midnight Pacific time")
+                return all_entries if all_entries else []
+
+            # Make the API request (reuses the pooled connection)
+            response = http_session.get(url, params=params, headers=page_headers, timeout=30)
 
-            # Make the API request
-            response = requests.get(url, params=params, headers=request_headers, timeout=30)
+            log_debug("API response status: %s, content-length: %s", response.status_code, len(response.content))
 
-            log_debug(f"API response status: {response.status_code}, content-length: {len(response.content)}")
+            # First page unchanged - no new uploads, reuse the last entries
+            if response.status_code == 304:
+                log_message("YouTube API results not modified since last check")
+                return list(api_cache["entries"])
             
             # Check for HTTP errors
             if response.status_code == 403:
@@ -875,36 +2074,39 @@ def get_youtube_feed_api():
                 log_error("  3. You haven't exceeded your API quota")
                 # Try to extract a more specific error message from the response body
                 try:
-                    error_body = response.json()
+                    error_body = json_loads(response.content)
                     error_detail = error_body.get("error", {}).get("message", "")
                     if error_detail:
                         log_error(f"  API error detail: {error_detail}")
-                    log_debug(f"Full 403 response body: {json.dumps(error_body, indent=2)}")
+                    if debug_log_enabled:
+                        log_debug("Full 403 response body: %s", json.dumps(error_body, indent=2))
                 except (json.JSONDecodeError, Exception):
-                    log_debug(f"Could not parse 403 response body: {response.text[:500]}")
+                    log_debug("Could not parse 403 response body: %s", response.text[:500])
                 return all_entries if all_entries else []
 
             elif response.status_code == 404:
                 log_error(f"Playlist not found (HTTP 404). Check that channel ID '{channel_id}' is correct")
-                log_debug(f"404 response for playlist: {uploads_playlist_id}")
+                log_debug("404 response for playlist: %s", uploads_playlist_id)
                 return all_entries if all_entries else []
 
             elif response.status_code == 400:
                 # Bad request - often caused by invalid parameters or API key format
                 log_error(f"Bad API request (HTTP 400). The request parameters may be invalid.")
                 try:
-                    error_body = response.json()
+                    error_body = json_loads(response.content)
                     error_detail = error_body.get("error", {}).get("message", "")
                     if error_detail:
                         log_error(f"  API error detail: {error_detail}")
-                    log_debug(f"Full 400 response body: {json.dumps(error_body, indent=2)}")
+                    if debug_log_enabled:
+                        log_debug("Full 400 response body: %s", json.dumps(error_body, indent=2))
                 except (json.JSONDecodeError, Exception):
-                    log_debug(f"Could not parse 400 response body: {response.text[:500]}")
+                    log_debug("Could not parse 400 response body: %s", response.text[:500])
                 return all_entries if all_entries else []
 
             elif response.status_code == 429:
                 # Rate limited by the API
                 log_warning("YouTube API rate limit hit (HTTP 429). Waiting before retrying...")
+                note_retry_after(response)
                 log_debug("Rate limited. Returning partial results if available.")
                 return all_entries if all_entries else []
             
@@ -916,15 +2118,19 @@ def get_youtube_feed_api():
                 log_exception("HTTP error from YouTube API", http_err)
                 return all_entries if all_entries else []
             
-            # Parse the JSON response
-            data = response.json()
+            # Parse the JSON response straight from the raw bytes
+            data = json_loads(response.content)
+
+            if page_count == 1:
+                first_page_etag = response.headers.get("ETag")
             
             # Check for API errors in the response
             if "error" in data:
                 error_msg = data["error"].get("message", "Unknown API error")
                 error_code = data["error"].get("code", "N/A")
                 log_error(f"YouTube API error (code {error_code}): {error_msg}")
-                log_debug(f"Full API error response: {json.dumps(data['error'], indent=2)}")
+                if debug_log_enabled:
+                    log_debug("Full API error response: %s", json.dumps(data['error'], indent=2))
                 return all_entries if all_entries else []
             
             # Process items from this page
@@ -938,6 +2144,9 @@ def get_youtube_feed_api():
             # Track how many items were skipped on this page (missing video ID)
             skipped_count = 0
 
+            # Whether this page reached videos we've already seen
+            reached_seen = False
+
             # Convert API response to the same format as RSS entries
             for item in items:
                 snippet = item.get("snippet", {})
@@ -949,17 +2158,20 @@ def get_youtube_feed_api():
                 
                 if not video_id:
                     skipped_count += 1
-                    log_debug(f"Skipped API item with no video ID: {json.dumps(item, indent=2)[:300]}")
+                    if debug_log_enabled:
+                        log_debug("Skipped API item with no video ID: %s", json.dumps(item, indent=2)[:300])
                     continue  # Skip items without a video ID
+
+                if seen_videos is not None and video_id in seen_videos:
+                    reached_seen = True
                 
-                # Build an entry object compatible with feedparser format
+                # Build an entry object with the same keys as the RSS entries
                 entry = {
                     "yt_videoid": video_id,
                     "id": video_id,
                     "title": snippet.get("title", "Unknown Title"),
                     "link": f"https://www.youtube.com/watch?v={video_id}",
                     "published": snippet.get("publishedAt", ""),
-                    "description": snippet.get("description", ""),
                 }
                 all_entries.append(entry)
 
@@ -975,11 +2187,19 @@ def get_youtube_feed_api():
             if not next_page_token:
                 log_message("Reached end of playlist")
                 break
-            
-            # Small delay between API requests to be respectful of rate limits
-            time.sleep(0.5)
+
+            # Older pages only contain videos we've already seen
+            if reached_seen:
+                log_debug("Page %s reached already seen videos, not fetching older pages", page_count)
+                break
         
         log_success(f"YouTube API returned {len(all_entries)} videos total")
+
+        # Remember the first page's ETag for the next conditional request
+        # (only reached when every page was fetched without errors)
+        api_cache["etag"] = first_page_etag
+        api_cache["key"] = cache_key
+        api_cache["entries"] = all_entries
         return all_entries
         
     except requests.exceptions.Timeout:
@@ -1003,26 +2223,30 @@ def get_youtube_feed_api():
         return all_entries if all_entries else []
 
 
-def get_videos():
+def get_videos(seen_videos=None):
     """
     Fetches videos from YouTube using either RSS or API based on configuration.
     
     This is a wrapper function that delegates to either get_youtube_feed()
     or get_youtube_feed_api() based on the --use-api flag.
     
+    Args:
+        seen_videos: Optional set of already seen video IDs, passed on to
+                     get_youtube_feed_api() to stop pagination early
+    
     Returns:
         A list of video entries from the feed/API, or empty list on error
     """
-    log_debug(f"Fetching videos using {'YouTube API' if use_youtube_api else 'RSS feed'}")
+    log_debug("Fetching videos using %s", 'YouTube API' if use_youtube_api else 'RSS feed')
     if dual_mode:
-        return get_videos_dual()
+        return get_videos_dual(seen_videos)
     elif use_youtube_api:
-        return get_youtube_feed_api()
+        return get_youtube_feed_api(seen_videos)
     else:
         return get_youtube_feed()
 
 
-def get_videos_dual():
+def get_videos_dual(seen_videos=None):
     """
     Fetches videos from both RSS feed and YouTube Data API simultaneously.
     
@@ -1030,11 +2254,19 @@ def get_videos_dual():
     as the unique key to prevent duplicates. API metadata is preferred when
     a video is found in both sources (based on dual_mode_preference config).
     
+    The two requests run in parallel on a pair of worker threads, so a
+    dual mode check takes about as long as the slower source instead of
+    the sum of both.
+    
     Edge cases handled:
     - Duplicate videos: API version is kept (configurable via dual_mode_preference)
     - One source fails: Warning is logged, continues with successful source
     - No API key: Returns RSS results only with a warning
     
+    Args:
+        seen_videos: Optional set of already seen video IDs, passed on to
+                     get_youtube_feed_api() to stop pagination early
+    
     Returns:
         A merged list of video entries from both sources (duplicates removed),
         or empty list if both sources fail
@@ -1048,35 +2280,45 @@ def get_videos_dual():
         log_warning(f"Invalid dual_mode_preference '{preference}', using 'api'")
         preference = "api"
 
-    log_debug(f"Dual mode preference: {preference} (used when video found in both sources)")
+    log_debug("Dual mode preference: %s (used when video found in both sources)", preference)
 
     # Fetch from both sources
     rss_entries = []
     api_entries = []
 
-    # Fetch RSS feed
-    try:
+    # Check if API key is configured
+    api_key = config.get("youtube_api_key", "")
+    api_configured = config_value_is_set("youtube_api_key", api_key)
+    if not api_configured:
+        log_warning("YouTube API key not configured - cannot use API in dual mode")
+        log_warning("Consider adding youtube_api_key to config.yaml or use --use-api flag only")
+
+    # Start both requests at once. Both use the shared http_session,
+    # whose connection pool has room for several connections.
+    with ThreadPoolExecutor(max_workers=2) as executor:
         log_message("Fetching from RSS feed...")
-        rss_entries = get_youtube_feed()
-        log_debug(f"RSS feed returned {len(rss_entries)} videos")
-    except Exception as e:
-        log_warning(f"RSS feed fetch failed: {e}")
-        log_debug(f"RSS exception type: {type(e).__name__}")
-
-    # Fetch from API
-    try:
-        # Check if API key is configured
-        api_key = config.get("youtube_api_key", "")
-        if not api_key or api_key == "YOUR_YOUTUBE_API_KEY_HERE":
-            log_warning("YouTube API key not configured - cannot use API in dual mode")
-            log_warning("Consider adding youtube_api_key to config.yaml or use --use-api flag only")
-        else:
+        rss_future = executor.submit(get_youtube_feed)
+        api_future = None
+        if api_configured:
             log_message("Fetching from YouTube API...")
-            api_entries = get_youtube_feed_api()
-            log_debug(f"API returned {len(api_entries)} videos")
-    except Exception as e:
-        log_warning(f"YouTube API fetch failed: {e}")
-        log_debug(f"API exception type: {type(e).__name__}")
+            api_future = executor.submit(get_youtube_feed_api, seen_videos)
+
+        # Collect RSS results (result() re-raises any exception from the thread)
+        try:
+            rss_entries = rss_future.result()
+            log_debug("RSS feed returned %s videos", len(rss_entries))
+        except Exception as e:
+            log_warning(f"RSS feed fetch failed: {e}")
+            log_debug("RSS exception type: %s", type(e).__name__)
+
+        # Collect API results
+        if api_future is not None:
+            try:
+                api_entries = api_future.result()
+                log_debug("API returned %s videos", len(api_entries))
+            except Exception as e:
+                log_warning(f"YouTube API fetch failed: {e}")
+                log_debug("API exception type: %s", type(e).__name__)
 
     # If both failed, return empty list
     if not rss_entries and not api_entries:
@@ -1099,187 +2341,783 @@ def get_videos_dual():
     if api_preferred:
         # API preferred: add API entries first, then RSS only for new videos
         for entry in api_entries:
-            video_id = entry.get("yt_videoid", entry.get("id", ""))
+            video_id = entry.get("yt_videoid") or entry.get("id") or ""
             if video_id:
                 merged_videos[video_id] = entry
 
         # Add RSS entries only if not already in merged_videos
         rss_only_count = 0
         for entry in rss_entries:
-            video_id = entry.get("yt_videoid", entry.get("id", ""))
+            video_id = entry.get("yt_videoid") or entry.get("id") or ""
             if video_id and video_id not in merged_videos:
                 merged_videos[video_id] = entry
                 rss_only_count += 1
 
-        log_message(f"Dual mode merge complete: {len(merged_videos)} unique videos "
-                   f"({len(api_entries)} from API, {rss_only_count} RSS-only)", Colors.GREEN)
-    else:
-        # RSS preferred: add RSS entries first, then API only for new videos
-        for entry in rss_entries:
-            video_id = entry.get("yt_videoid", entry.get("id", ""))
-            if video_id:
-                merged_videos[video_id] = entry
+        log_message(f"Dual mode merge complete: {len(merged_videos)} unique videos "
+                   f"({len(api_entries)} from API, {rss_only_count} RSS-only)", Colors.GREEN)
+    else:
+        # RSS preferred: add RSS entries first, then API only for new videos
+        for entry in rss_entries:
+            video_id = entry.get("yt_videoid") or entry.get("id") or ""
+            if video_id:
+                merged_videos[video_id] = entry
+
+        # Add API entries only if not already in merged_videos
+        api_only_count = 0
+        for entry in api_entries:
+            video_id = entry.get("yt_videoid") or entry.get("id") or ""
+            if video_id and video_id not in merged_videos:
+                merged_videos[video_id] = entry
+                api_only_count += 1
+
+        log_message(f"Dual mode merge complete: {len(merged_videos)} unique videos "
+                   f"({len(rss_entries)} from RSS, {api_only_count} API-only)", Colors.GREEN)
+
+    # Convert dict values back to list
+    result = list(merged_videos.values())
+    log_debug("Dual mode returning %s merged video entries", len(result))
+
+    return result
+
+
+@lru_cache(maxsize=1024)
+def extract_video_id(video_url):
+    """
+    Extracts the YouTube video ID from a URL.
+    
+    Handles the common YouTube URL formats (see VIDEO_ID_PATTERN):
+    - https://www.youtube.com/watch?v=VIDEO_ID
+    - https://youtu.be/VIDEO_ID
+    - https://www.youtube.com/shorts/VIDEO_ID
+    - https://www.youtube.com/embed/VIDEO_ID
+    - https://www.youtube.com/live/VIDEO_ID
+    A bare 11-character video ID is returned as-is.
+    
+    Results are cached (lru_cache), so a URL that comes around again,
+    e.g. when a failed post is retried, is only parsed once.
+    
+    Args:
+        video_url: The full YouTube URL
+        
+    Returns:
+        The video ID string (11 characters), or None if not found
+    """
+    video_id = None
+
+    # Already just an ID (e.g. dQw4w9WgXcQ)
+    if BARE_VIDEO_ID_PATTERN.fullmatch(video_url):
+        video_id = video_url
+    else:
+        # One regex scan finds the ID in any of the supported URL formats
+        # Example: https://www.youtube.com/watch?v=dQw4w9WgXcQ
+        match = VIDEO_ID_PATTERN.search(video_url)
+        if match:
+            video_id = match.group(1)
+
+    # Log whether extraction succeeded or failed
+    if video_id:
+        log_debug("Extracted video ID '%s' from URL: %s", video_id, video_url)
+    else:
+        log_debug("Could not extract video ID from URL: %s", video_url)
+    
+    return video_id
+
+
+def download_thumbnail(thumb_url):
+    """
+    Downloads a single thumbnail image.
+    
+    The response is streamed and copied into memory in THUMBNAIL_CHUNK_SIZE
+    chunks. If the server sends a Content-Length at or below
+    MIN_THUMBNAIL_BYTES, the placeholder image is skipped without reading
+    its body at all.
+    
+    Args:
+        thumb_url: The thumbnail image URL
+        
+    Returns:
+        The image bytes, or None if the image is too small (a placeholder)
+        
+    Raises:
+        requests.exceptions.RequestException: If the download fails
+    """
+    # Download the image with a 10-second timeout
+    with http_session.get(thumb_url, stream=True, timeout=10) as response:
+        # Raise an exception for HTTP errors (4xx, 5xx)
+        response.raise_for_status()
+
+        # Skip placeholders before downloading them, if the size is known
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) <= MIN_THUMBNAIL_BYTES:
+            log_debug("Thumbnail too small (Content-Length %s), trying next quality", content_length)
+            return None
+
+        # Copy the body in large chunks into one in-memory buffer
+        response.raw.decode_content = True
+        buffer = io.BytesIO()
+        shutil.copyfileobj(response.raw, buffer, THUMBNAIL_CHUNK_SIZE)
+        image_data = buffer.getvalue()
+
+    log_debug("Thumbnail response: status=%s, size=%s bytes", response.status_code, len(image_data))
+
+    # Check if we got a valid image
+    # maxresdefault sometimes returns a small placeholder if not available
+    # Valid thumbnails are larger than 1KB
+    if len(image_data) <= MIN_THUMBNAIL_BYTES:
+        log_debug("Thumbnail too small (%s bytes), trying next quality", len(image_data))
+        return None
+
+    return image_data
+
+
+def fetch_thumbnail(thumb_url, abandoned):
+    """
+    Downloads one thumbnail quality, turning errors into debug messages.
+    
+    Runs on a worker thread from download_best_thumbnail(), so every
+    error is caught and logged here instead of being raised. A missing
+    quality is normal (many videos have no maxresdefault image), so
+    failures are only logged at debug level; download_best_thumbnail()
+    warns if every quality failed.
+    
+    Args:
+        thumb_url: The img.youtube.com URL of the thumbnail
+        abandoned: threading.Event set once a better quality was picked,
+            after which this download's result is no longer wanted
+        
+    Returns:
+        The image bytes, or None if it failed, was a placeholder or was
+        no longer needed
+    """
+    # A better quality already won while this one waited for a worker
+    if abandoned.is_set():
+        return None
+
+    try:
+        log_debug("Downloading thumbnail: %s", thumb_url)
+        image_data = download_thumbnail(thumb_url)
+
+    except requests.exceptions.Timeout:
+        # Thumbnail download timed out, another quality may still work
+        log_debug("Thumbnail download timed out for %s", thumb_url)
+        return None
+
+    except requests.exceptions.ConnectionError as e:
+        # Network-level failure downloading thumbnail
+        log_debug("Connection error downloading thumbnail from %s: %s", thumb_url, e)
+        return None
+
+    except requests.exceptions.HTTPError as e:
+        # HTTP error (4xx, 5xx), e.g. a video without this quality
+        log_debug("HTTP error downloading thumbnail from %s: %s", thumb_url, e)
+        return None
+
+    except Exception as e:
+        # This thumbnail quality failed, another one may still work
+        log_debug("Thumbnail download failed for %s: %r", thumb_url, e)
+        return None
+
+    # Finished after a better quality was already picked - drop it
+    if abandoned.is_set():
+        log_debug("Discarding thumbnail no longer needed: %s", thumb_url)
+        return None
+    return image_data
+
+
+def get_video_thumbnail(client, video_id):
+    """
+    Downloads a YouTube video thumbnail and uploads it to Bluesky.
+    
+    YouTube provides thumbnails at predictable URLs based on video ID.
+    This function tries multiple thumbnail qualities (highest first)
+    and uploads the successful one to Bluesky.
+    
+    All qualities are requested at the same time on worker threads
+    (see download_best_thumbnail()). Many videos have no maxresdefault
+    image, and asking for the sizes one after another cost an extra
+    round-trip for each missing one. The results are still checked in
+    quality order. Downloads that are no longer needed are cancelled if
+    they haven't started yet, and their results are discarded otherwise.
+    
+    Args:
+        client: The authenticated Bluesky client
+        video_id: The YouTube video ID
+        
+    Returns:
+        The uploaded blob object, or None if failed
+    """
+    # Without a video ID we can't build the thumbnail URLs
+    if not video_id:
+        log_warning("No video ID, skipping the thumbnail")
+        return None
+
+    # Use the image prefetched or kept from a failed upload, if we have it
+    image_data = thumbnail_image_cache.get(video_id)
+    if image_data is not None:
+        log_debug("Using thumbnail downloaded earlier for %s", video_id)
+        return upload_thumbnail(client, video_id, image_data)
+
+    image_data = download_best_thumbnail(video_id)
+    if image_data is None:
+        return None
+
+    return upload_thumbnail(client, video_id, image_data)
+
+
+def download_best_thumbnail(video_id):
+    """
+    Downloads the highest quality thumbnail available for a video.
+    
+    Args:
+        video_id: The YouTube video ID
+        
+    Returns:
+        The image bytes, or None if every quality failed
+    """
+    # YouTube provides thumbnails at predictable URLs in different sizes
+    # We prefer the highest quality, then fall back to lower qualities
+    # (see THUMBNAIL_NAMES)
+    # Start all downloads at once
+    abandoned = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(THUMBNAIL_NAMES))
+    try:
+        futures = [
+            executor.submit(fetch_thumbnail, f"https://img.youtube.com/vi/{video_id}/{name}", abandoned)
+            for name in THUMBNAIL_NAMES
+        ]
+
+        # Take the best quality that worked
+        # (a None result means it failed or was a placeholder)
+        image_data = None
+        for future in futures:
+            image_data = future.result()
+            if image_data is not None:
+                break
+    finally:
+        # Don't wait for lower qualities we no longer need; any still
+        # running see the abandoned flag and throw their result away
+        abandoned.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if image_data is None:
+        # All thumbnail attempts failed
+        log_warning("All thumbnail attempts failed")
+        return None
+
+    return shrink_thumbnail(image_data)
+
+
+def shrink_thumbnail(image_data):
+    """
+    Scales a thumbnail down to THUMBNAIL_MAX_SIZE and re-encodes it as WebP.
+    
+    Only done when Pillow is installed. A 1280x720 JPEG becomes several
+    times smaller, so the upload to Bluesky is quicker. If anything goes
+    wrong, or the result isn't smaller, the original image is kept.
+    
+    Args:
+        image_data: The downloaded image bytes
+        
+    Returns:
+        The smaller image bytes, or image_data unchanged
+    """
+    try:
+        # Loaded on first use (see the note at the imports)
+        from PIL import Image
+    except ImportError:
+        return image_data
+
+    try:
+        with Image.open(io.BytesIO(image_data)) as img:
+            # thumbnail() keeps the aspect ratio and never scales up
+            img.thumbnail(THUMBNAIL_MAX_SIZE, Image.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, "WEBP", quality=THUMBNAIL_WEBP_QUALITY)
+    except Exception as e:
+        # Corrupt image or a Pillow built without WebP support
+        log_debug("Could not shrink thumbnail, uploading it as is: %s", e)
+        return image_data
+
+    shrunk_data = buffer.getvalue()
+    if len(shrunk_data) >= len(image_data):
+        return image_data
+
+    log_debug("Shrunk thumbnail from %s to %s bytes", len(image_data), len(shrunk_data))
+    return shrunk_data
+
+
+def get_cached_thumbnail_blob(video_id):
+    """
+    Returns the thumbnail uploaded for an earlier failed post of a video.
+    
+    Blobs older than THUMBNAIL_BLOB_MAX_AGE are removed from
+    thumbnail_blob_cache instead, so a fresh one gets uploaded.
+    
+    Args:
+        video_id: The YouTube video ID
+        
+    Returns:
+        The blob reference, or None if there is no usable one
+    """
+    cached = thumbnail_blob_cache.get(video_id)
+    if cached is None:
+        return None
+
+    thumb_blob, uploaded_at = cached
+    if time.monotonic() - uploaded_at > THUMBNAIL_BLOB_MAX_AGE:
+        log_debug("Uploaded thumbnail for %s is too old to reuse", video_id)
+        thumbnail_blob_cache.pop(video_id, None)
+        return None
+    return thumb_blob
+
+
+def prefetch_thumbnails(video_ids):
+    """
+    Downloads the thumbnails for several new videos at the same time.
+    
+    Posts go out one after another, so without this each video's
+    thumbnail download would wait for the previous post. The images
+    are stored in thumbnail_image_cache, where get_video_thumbnail()
+    picks them up.
+    
+    Args:
+        video_ids: List of YouTube video IDs
+    """
+    # Skip videos we already have an image for, and download each video's
+    # thumbnail only once even if the feed lists the video twice
+    # (dict.fromkeys drops duplicates but keeps the order)
+    video_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in thumbnail_image_cache]
+    if not video_ids:
+        return
+
+    log_debug("Prefetching thumbnails for %s videos", len(video_ids))
+    with ThreadPoolExecutor(max_workers=THUMBNAIL_PREFETCH_WORKERS) as executor:
+        for video_id, image_data in zip(video_ids, executor.map(download_best_thumbnail, video_ids)):
+            if image_data is not None:
+                thumbnail_image_cache[video_id] = image_data
+
+
+def upload_thumbnail(client, video_id, image_data):
+    """
+    Uploads a downloaded thumbnail image to Bluesky.
+    
+    If the upload fails, the image is kept in thumbnail_image_cache so
+    the next attempt for this video doesn't download it again.
+    
+    Args:
+        client: The authenticated Bluesky client
+        video_id: The YouTube video ID the thumbnail belongs to
+        image_data: The image bytes
+        
+    Returns:
+        The uploaded blob object, or None if the upload failed
+    """
+    # upload_blob returns an object with a 'blob' attribute
+    try:
+        upload_response = call_bluesky(client.upload_blob, image_data)
+        log_success("Thumbnail uploaded successfully")
+        log_debug("Thumbnail blob uploaded, size: %s bytes", len(image_data))
+        thumbnail_image_cache.pop(video_id, None)
+        # Return the blob reference (used in the embed)
+        return upload_response.blob
+    except Exception as upload_err:
+        # Handle Bluesky upload failures separately from download failures
+        log_exception("Failed to upload thumbnail to Bluesky", upload_err)
+        thumbnail_image_cache[video_id] = image_data
+        return None
+
+
+def save_bluesky_session(session_string, login, did):
+    """
+    Saves the Bluesky session string so it can be reused on the next run.
+    
+    The file is a small JSON object that also records the bluesky_handle
+    the session was logged in with (which may be an email address or a
+    DID rather than a handle) and the account's DID, so a later run can
+    tell whether the session belongs to the configured account.
+    
+    The file is created with 0600 permissions (readable only by the
+    current user) because the session grants access to the account.
+    
+    The session is written to a temporary file first and then renamed
+    over the old one with os.replace(), which is atomic. If the script
+    is killed mid-write, the previous session file is left intact
+    instead of being truncated.
+    
+    Args:
+        session_string: The string from Client.export_session_string()
+        login: The bluesky_handle from config used to log in
+        did: The DID of the logged-in account
+    """
+    session_file = config.get("bluesky_session_file", "bluesky_session.txt")
+    data = {"login": login, "did": did, "session": session_string}
+
+    temp_file = session_file + ".tmp"
+
+    try:
+        # os.open lets us set the file permissions at creation time
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        # Swap the new file in place of the old one in a single step
+        os.replace(temp_file, session_file)
+        log_debug("Saved Bluesky session to %s", session_file)
+    except OSError as e:
+        # Not fatal - we will just log in with the password next time
+        log_warning(f"Could not save Bluesky session to {session_file}: {e}")
+
+
+def load_bluesky_session():
+    """
+    Loads a previously saved Bluesky session.
+    
+    Returns:
+        A dict with "login", "did" and "session" (see save_bluesky_session),
+        or None if there is no usable saved session
+    """
+    session_file = config.get("bluesky_session_file", "bluesky_session.txt")
+
+    # Just try to open it; a missing file is the common "no session" case
+    try:
+        with open(session_file, "r") as f:
+            data = json_loads(f.read())
+    except FileNotFoundError:
+        log_debug("No saved Bluesky session at %s", session_file)
+        return None
+    except OSError as e:
+        log_warning(f"Could not read Bluesky session from {session_file}: {e}")
+        return None
+    except json.JSONDecodeError:
+        # Older versions saved only the session string, without the account
+        log_debug("Saved Bluesky session at %s has an old format, ignoring it", session_file)
+        return None
+
+    if not isinstance(data, dict) or not data.get("session") or not data.get("login"):
+        log_debug("Saved Bluesky session at %s is incomplete, ignoring it", session_file)
+        return None
+    return data
+
+
+def get_bluesky_client():
+    """
+    Returns a logged-in Bluesky client, logging in only when needed.
+    
+    Logging in for every post costs an extra round-trip and counts
+    against Bluesky's login rate limit. Instead, the client is created
+    once and reused. The session is also saved to bluesky_session_file
+    so that restarts can resume it instead of logging in again.
+    
+    Order of attempts:
+    1. The client already logged in during this run
+    2. The saved session from bluesky_session_file
+    3. A fresh login with bluesky_handle and bluesky_password
+    
+    The atproto client refreshes expired access tokens by itself. Every
+    time the session changes, the new session is saved to disk.
+    
+    main() calls this once in a background thread at startup, so the
+    login happens while the first feed is being fetched.
+    
+    Returns:
+        A logged-in atproto Client, or None if login failed
+    """
+    global bluesky_client
+
+    # Only one thread logs in at a time. If the startup warm-up thread is
+    # still logging in, a post waits for it and then reuses its client.
+    with bluesky_client_lock:
+        # Reuse the client from a previous post
+        if bluesky_client is not None:
+            return bluesky_client
+
+        # Get credentials from config
+        handle = config.get("bluesky_handle", "")
+        password = config.get("bluesky_password", "")
+
+        # ==========================================
+        # Validate credentials before attempting login
+        # ==========================================
+        if not handle:
+            log_error("Bluesky handle is empty — cannot post")
+            return None
+        if not password:
+            log_error("Bluesky password is empty — cannot post")
+            return None
+
+        # Import the Bluesky library on first use (see IMPORTS above)
+        from atproto import Client
+
+        # Create a new Bluesky client instance
+        client = Client()
 
-        # Add API entries only if not already in merged_videos
-        api_only_count = 0
-        for entry in api_entries:
-            video_id = entry.get("yt_videoid", entry.get("id", ""))
-            if video_id and video_id not in merged_videos:
-                merged_videos[video_id] = entry
-                api_only_count += 1
+        # Save the session whenever it is created or refreshed, together
+        # with the login it belongs to
+        client.on_session_change(
+            lambda event, session: save_bluesky_session(client.export_session_string(), handle, session.did)
+        )
 
-        log_message(f"Dual mode merge complete: {len(merged_videos)} unique videos "
-                   f"({len(rss_entries)} from RSS, {api_only_count} API-only)", Colors.GREEN)
+        # Try to resume the saved session first, but only if it was made
+        # by logging in with the same bluesky_handle. That may be an email
+        # address or a DID, so compare the login itself rather than the
+        # profile handle the session reports.
+        saved_session = load_bluesky_session()
+        if saved_session and saved_session["login"].lower() != handle.lower():
+            log_warning(f"Saved Bluesky session is for '{saved_session['login']}', not '{handle}'. Logging in again.")
+        elif saved_session:
+            try:
+                profile = client.login(session_string=saved_session["session"])
+                # The session must still be for the account it was saved for
+                if profile is not None and saved_session.get("did") and profile.did != saved_session["did"]:
+                    log_warning(f"Saved Bluesky session is for a different account ({profile.did}). Logging in again.")
+                else:
+                    log_debug("Resumed saved Bluesky session for handle: %s", handle)
+                    bluesky_client = client
+                    return client
+            except Exception as session_err:
+                # Expired or revoked session - fall back to a password login
+                log_debug("Saved Bluesky session could not be used: %r", session_err)
+
+            # Start over with a clean client for the password login
+            client = Client()
+            client.on_session_change(
+                lambda event, session: save_bluesky_session(client.export_session_string(), handle, session.did)
+            )
 
-    # Convert dict values back to list
-    result = list(merged_videos.values())
-    log_debug(f"Dual mode returning {len(result)} merged video entries")
+        # Log in to Bluesky account
+        log_message(f"Logging in to Bluesky as {handle}...")
 
-    return result
+        try:
+            client.login(handle, password)
+            log_debug("Bluesky login successful for handle: %s", handle)
+        except Exception as login_err:
+            # Handle authentication failures specifically
+            log_error(f"Bluesky login failed for handle '{handle}'")
+            log_exception("Bluesky authentication error", login_err)
+            # Provide helpful hints based on common login issues
+            err_str = str(login_err).lower()
+            if "invalid" in err_str or "authentication" in err_str or "unauthorized" in err_str:
+                log_error("  Hint: Check your bluesky_handle and bluesky_password in config.yaml")
+                log_error("  Hint: Use an App Password from Bluesky settings, not your main password")
+            elif "rate" in err_str or "limit" in err_str:
+                log_error("  Hint: You may be rate-limited. Wait a few minutes and try again.")
+            elif "network" in err_str or "connection" in err_str or "resolve" in err_str:
+                log_error("  Hint: Network error. Check your internet connection.")
+            return None
 
+        bluesky_client = client
+        return client
 
-def extract_video_id(video_url):
+
+def format_post_text(post_template, video_title, video_url):
     """
-    Extracts the YouTube video ID from a URL.
+    Fills in the {title} and {url} placeholders of the post template.
     
-    Handles both standard YouTube URLs and shortened youtu.be URLs:
-    - https://www.youtube.com/watch?v=VIDEO_ID
-    - https://youtu.be/VIDEO_ID
+    The template is split into literal text and placeholders once and
+    cached, so each post is a simple join instead of running the
+    str.format() parser again. Templates using format specs or
+    conversions (e.g. {title!r}) fall back to str.format().
     
     Args:
-        video_url: The full YouTube URL
+        post_template: The post_template string from config
+        video_title: The title of the YouTube video
+        video_url: The URL to the video
         
     Returns:
-        The video ID string (11 characters), or None if not found
+        The post text
+        
+    Raises:
+        KeyError: If the template uses an unsupported placeholder
     """
-    video_id = None
+    # Parse the template only when it changed (e.g. after a config reload)
+    if post_template_cache["template"] != post_template:
+        parts = []
+        for literal, field, spec, conversion in string.Formatter().parse(post_template):
+            if spec or conversion:
+                # Too fancy for the fast path - let str.format() handle it
+                parts = None
+                break
+            parts.append((literal, field))
+        post_template_cache["template"] = post_template
+        post_template_cache["parts"] = parts
+
+    parts = post_template_cache["parts"]
+    if parts is None:
+        return post_template.format(title=video_title, url=video_url)
+
+    values = {"title": video_title, "url": video_url}
+    # field is None for trailing text without a placeholder
+    # An unknown placeholder raises KeyError, just like str.format()
+    return "".join(
+        literal + (values[field] if field is not None else "")
+        for literal, field in parts
+    )
+
+
+def shorten_post_text(post_text, video_url):
+    """
+    Cuts a post down to MAX_POST_LENGTH characters.
     
-    # Handle standard youtube.com/watch?v=VIDEO_ID format
-    # Example: https://www.youtube.com/watch?v=dQw4w9WgXcQ
-    if "v=" in video_url:
-        # Split on "v=" and take the part after it
-        # Then split on "&" to remove any additional parameters
-        video_id = video_url.split("v=")[1].split("&")[0]
+    The text is cut and ended with "…". If the post contains the video
+    URL, the URL is moved to the end and kept whole so the link still works.
+    The URL is never cut: if there is no room left for any other text,
+    the post is just the URL, and a URL longer than a whole post is left
+    out (the embed card still links to the video).
     
-    # Handle shortened youtu.be/VIDEO_ID format
-    # Example: https://youtu.be/dQw4w9WgXcQ
-    elif "youtu.be/" in video_url:
-        # Split on "youtu.be/" and take the part after it
-        # Then split on "?" to remove any query parameters
-        video_id = video_url.split("youtu.be/")[1].split("?")[0]
+    Args:
+        post_text: The formatted post text (longer than MAX_POST_LENGTH)
+        video_url: The URL to the video
+        
+    Returns:
+        The shortened post text
+    """
+    if video_url and video_url in post_text:
+        # Leave room for "… " plus the full URL at the end
+        text = post_text.replace(video_url, "").strip()
+        keep = MAX_POST_LENGTH - len(video_url) - 2
+        if keep > 0 and text:
+            return text[:keep].rstrip() + "… " + video_url
 
-    # Log whether extraction succeeded or failed
-    if video_id:
-        log_debug(f"Extracted video ID '{video_id}' from URL: {video_url}")
-    else:
-        log_debug(f"Could not extract video ID from URL: {video_url}")
-    
-    return video_id
+        # No room for the text next to the URL - post only the URL
+        if len(video_url) <= MAX_POST_LENGTH:
+            return video_url
+
+        # Even the URL alone is too long - shorten the text without it
+        post_text = text
 
+    return post_text[:MAX_POST_LENGTH - 1].rstrip() + "…"
 
-def get_video_thumbnail(client, video_url):
+
+def call_bluesky(func, *args, retry_network_errors=True, **kwargs):
     """
-    Downloads a YouTube video thumbnail and uploads it to Bluesky.
+    Calls a Bluesky client method, retrying transient failures.
     
-    YouTube provides thumbnails at predictable URLs based on video ID.
-    This function tries multiple thumbnail qualities (highest first)
-    and uploads the successful one to Bluesky.
+    Retries use exponential backoff with jitter, up to BLUESKY_MAX_RETRIES
+    times. A rate limit (HTTP 429) is always retried, waiting until the
+    ratelimit-reset time Bluesky sends if that is known. Network errors and
+    timeouts are only retried when retry_network_errors is True. A post
+    whose request timed out may still have been created, so send_post
+    passes False to avoid posting twice.
     
     Args:
-        client: The authenticated Bluesky client
-        video_url: The YouTube video URL
+        func: The client method to call, e.g. client.upload_blob
+        *args: Positional arguments for func
+        retry_network_errors: Whether network errors and timeouts are retried
+        **kwargs: Keyword arguments for func
         
     Returns:
-        The uploaded blob object, or None if failed
+        Whatever func returns
+        
+    Raises:
+        The last exception from func if every attempt failed
     """
-    # First, extract the video ID from the URL
-    video_id = extract_video_id(video_url)
-    
-    # If we couldn't extract the video ID, we can't get the thumbnail
-    if not video_id:
-        log_warning("Could not extract video ID from URL")
-        return None
+    # Already loaded by get_bluesky_client(), so this import is instant
+    from atproto import exceptions as atproto_exceptions
+
+    retryable = (atproto_exceptions.RateLimitExceededError,)
+    if retry_network_errors:
+        retryable += (atproto_exceptions.NetworkError, atproto_exceptions.InvokeTimeoutError)
+
+    for attempt in range(BLUESKY_MAX_RETRIES + 1):
+        try:
+            return func(*args, **kwargs)
+        except retryable as e:
+            if attempt == BLUESKY_MAX_RETRIES:
+                raise
+
+            delay = BLUESKY_RETRY_BASE_DELAY * 2 ** attempt * random.uniform(0.5, 1.5)
+
+            # Bluesky says when the rate limit resets (Unix time)
+            response = getattr(e, "response", None)
+            reset = response.headers.get("ratelimit-reset", "") if response is not None else ""
+            if reset.isdigit():
+                delay = max(delay, int(reset) - time.time())
+
+            if delay > BLUESKY_RETRY_MAX_DELAY:
+                raise
+
+            log_warning(f"Bluesky request failed ({type(e).__name__}), retrying in {delay:.1f} seconds...")
+
+            # Give up on the retry if the script is asked to stop meanwhile
+            if stop_event.wait(delay):
+                raise
+
+
+def is_transient_bluesky_error(error):
+    """
+    Tells whether a Bluesky error was a network problem or a rate limit.
     
-    # YouTube provides thumbnails at predictable URLs in different sizes
-    # We try the highest quality first, then fall back to lower qualities
-    # maxresdefault: 1280x720 (not always available)
-    # hqdefault: 480x360
-    # mqdefault: 320x180
-    thumbnail_urls = [
-        f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
-        f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg",
-        f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg",
-    ]
+    Those say nothing about the request itself, so anything prepared for
+    it (like an uploaded thumbnail) can be reused when it is retried.
     
-    # Try each thumbnail URL until one works
-    for thumb_url in thumbnail_urls:
-        try:
-            log_message(f"Downloading thumbnail: {thumb_url}")
-            
-            # Download the image with a 10-second timeout
-            response = requests.get(thumb_url, timeout=10)
-            # Raise an exception for HTTP errors (4xx, 5xx)
-            response.raise_for_status()
+    Args:
+        error: The exception raised by a Bluesky client call
+        
+    Returns:
+        True for network errors, timeouts and rate limits, False otherwise
+    """
+    # Already loaded by get_bluesky_client(), so this import is instant
+    from atproto import exceptions as atproto_exceptions
 
-            log_debug(f"Thumbnail response: status={response.status_code}, size={len(response.content)} bytes")
-            
-            # Check if we got a valid image
-            # maxresdefault sometimes returns a small placeholder if not available
-            # Valid thumbnails are larger than 1KB
-            if len(response.content) > 1000:
-                # Upload the image to Bluesky
-                # upload_blob returns an object with a 'blob' attribute
-                try:
-                    upload_response = client.upload_blob(response.content)
-                    log_success("Thumbnail uploaded successfully")
-                    log_debug(f"Thumbnail blob uploaded, size: {len(response.content)} bytes")
-                    # Return the blob reference (used in the embed)
-                    return upload_response.blob
-                except Exception as upload_err:
-                    # Handle Bluesky upload failures separately from download failures
-                    log_exception("Failed to upload thumbnail to Bluesky", upload_err)
-                    return None
-            else:
-                # Image was too small — likely a placeholder, try next quality
-                log_debug(f"Thumbnail too small ({len(response.content)} bytes), trying next quality")
+    return isinstance(error, (
+        atproto_exceptions.RateLimitExceededError,
+        atproto_exceptions.NetworkError,
+        atproto_exceptions.InvokeTimeoutError,
+    ))
 
-        except requests.exceptions.Timeout:
-            # Thumbnail download timed out, try next quality
-            log_warning(f"Thumbnail download timed out for {thumb_url}")
-            continue
 
-        except requests.exceptions.ConnectionError as e:
-            # Network-level failure downloading thumbnail
-            log_warning(f"Connection error downloading thumbnail from {thumb_url}: {e}")
-            continue
+def reset_bluesky_client():
+    """
+    Forgets the logged-in Bluesky client, so the next post logs in again.
+    
+    Thumbnails uploaded with the old client are dropped as well: they
+    belong to that session's account and may not be usable any more.
+    """
+    global bluesky_client
 
-        except requests.exceptions.HTTPError as e:
-            # HTTP error (4xx, 5xx) downloading thumbnail
-            log_warning(f"HTTP error downloading thumbnail from {thumb_url}: {e}")
-            continue
+    with bluesky_client_lock:
+        bluesky_client = None
+        thumbnail_blob_cache.clear()
 
-        except Exception as e:
-            # This thumbnail quality failed, try the next one
-            log_warning(f"Thumbnail download failed for {thumb_url}: {e}")
-            log_debug(f"Thumbnail exception type: {type(e).__name__}")
-            continue
+
+def wait_for_post_slot():
+    """
+    Waits until Bluesky's rate limit allows another post.
     
-    # All thumbnail attempts failed
-    log_warning("All thumbnail attempts failed")
-    return None
+    Uses a TokenBucket refilling at BLUESKY_POSTS_PER_HOUR. Up to
+    POST_BURST posts go out back to back, so a few new videos are posted
+    without any pause; only a longer catch-up is spaced out. Called right
+    before each post is sent, so the thumbnail work for the next video
+    overlaps with any wait.
+    
+    Returns:
+        True when the post can be sent, False if the script was asked to
+        stop while waiting
+    """
+    global post_bucket
+
+    if post_bucket is None:
+        post_bucket = TokenBucket(BLUESKY_POSTS_PER_HOUR / 3600, POST_BURST)
+    return post_bucket.acquire()
 
 
-def post_to_bluesky(video_title, video_url):
+def post_to_bluesky(video_id, video_title, video_url):
     """
     Creates a post on Bluesky with a rich link preview card.
     
     This function:
-    1. Logs into Bluesky using credentials from config
+    1. Gets the logged-in Bluesky client (see get_bluesky_client)
     2. Downloads the video thumbnail from YouTube
     3. Uploads the thumbnail to Bluesky
     4. Creates a post with an embed card (link preview)
     
+    If sending the post fails with a network error or rate limit after
+    the thumbnail was uploaded, the uploaded blob is kept in
+    thumbnail_blob_cache, so the retry on the next check cycle skips
+    steps 2 and 3. For any other failure the blob is dropped, since it
+    may be the reason the post was rejected.
+    
     Args:
+        video_id: The YouTube video ID from the feed entry
         video_title: The title of the YouTube video
         video_url: The URL to the video
         
@@ -1287,49 +3125,20 @@ def post_to_bluesky(video_title, video_url):
         True if posting succeeded, False otherwise
     """
     try:
-        # Create a new Bluesky client instance
-        client = Client()
-        
-        # Get credentials and settings from config
-        handle = config.get("bluesky_handle", "")
-        password = config.get("bluesky_password", "")
-        post_template = config.get("post_template", "🎬 New video: {title}")
-
-        # ==========================================
-        # Validate credentials before attempting login
-        # ==========================================
-        if not handle:
-            log_error("Bluesky handle is empty — cannot post")
-            return False
-        if not password:
-            log_error("Bluesky password is empty — cannot post")
+        # Get the logged-in client (logs in only if needed)
+        client = get_bluesky_client()
+        if client is None:
             return False
-        
-        # Log in to Bluesky account
-        log_message(f"Logging in to Bluesky as {handle}...")
 
-        try:
-            client.login(handle, password)
-            log_debug(f"Bluesky login successful for handle: {handle}")
-        except Exception as login_err:
-            # Handle authentication failures specifically
-            log_error(f"Bluesky login failed for handle '{handle}'")
-            log_exception("Bluesky authentication error", login_err)
-            # Provide helpful hints based on common login issues
-            err_str = str(login_err).lower()
-            if "invalid" in err_str or "authentication" in err_str or "unauthorized" in err_str:
-                log_error("  Hint: Check your bluesky_handle and bluesky_password in config.yaml")
-                log_error("  Hint: Use an App Password from Bluesky settings, not your main password")
-            elif "rate" in err_str or "limit" in err_str:
-                log_error("  Hint: You may be rate-limited. Wait a few minutes and try again.")
-            elif "network" in err_str or "connection" in err_str or "resolve" in err_str:
-                log_error("  Hint: Network error. Check your internet connection.")
-            return False
+        # Already loaded by get_bluesky_client(), so this import is instant
+        from atproto import models
+
+        post_template = config.get("post_template", "🎬 New video: {title}")
         
         # Build the post text using the template from config
         # {title} and {url} are replaced with actual values
         try:
-            post_text = post_template.format(title=video_title, url=video_url)
+            post_text = format_post_text(post_template, video_title, video_url)
         except KeyError as fmt_err:
             # Handle invalid placeholders in the template (e.g., {nonexistent})
             log_error(f"Invalid placeholder in post_template: {fmt_err}")
@@ -1339,18 +3148,34 @@ def post_to_bluesky(video_title, video_url):
             post_text = f"🎬 New video: {video_title}"
             log_warning(f"Using fallback post text: {post_text}")
 
-        log_debug(f"Post text ({len(post_text)} chars): {post_text}")
+        log_debug("Post text (%s chars): %s", len(post_text), post_text)
 
         # Check Bluesky post length limit (300 characters as of current AT Protocol)
-        if len(post_text) > 300:
-            log_warning(f"Post text is {len(post_text)} characters (Bluesky limit is 300). It may be truncated or rejected.")
+        # Bluesky rejects longer posts, so shorten it here instead of
+        # making a request that is bound to fail
+        if len(post_text) > MAX_POST_LENGTH:
+            log_warning(f"Post text is {len(post_text)} characters (Bluesky limit is {MAX_POST_LENGTH}). Shortening it.")
+            post_text = shorten_post_text(post_text, video_url)
+            log_debug("Shortened post text (%s chars): %s", len(post_text), post_text)
         
         # ==============================================
         # Download and upload the video thumbnail
         # ==============================================
         
-        # Get the thumbnail blob (or None if it failed)
-        thumb_blob = get_video_thumbnail(client, video_url)
+        # Reuse the thumbnail from an earlier failed attempt if we have one,
+        # otherwise get the thumbnail blob (or None if it failed)
+        # Feed entries normally carry the plain video ID already;
+        # only parse it out of the URL if they didn't
+        if not BARE_VIDEO_ID_PATTERN.fullmatch(video_id):
+            video_id = extract_video_id(video_url)
+
+        thumb_blob = get_cached_thumbnail_blob(video_id)
+        if thumb_blob is not None:
+            log_debug("Reusing thumbnail uploaded on an earlier attempt for %s", video_id)
+        else:
+            thumb_blob = get_video_thumbnail(client, video_id)
+            if thumb_blob and video_id:
+                thumbnail_blob_cache[video_id] = (thumb_blob, time.monotonic())
         
         # ==============================================
         # Create the embed card (link preview)
@@ -1383,8 +3208,16 @@ def post_to_bluesky(video_title, video_url):
         
         # send_post creates the post on Bluesky
         # text: the post content, embed: the link preview card
+        # Stay within Bluesky's rate limits
+        # A stop request during the wait leaves the video for the next run
+        if not wait_for_post_slot():
+            log_message(f"Stop requested, not posting: {video_title}", Colors.YELLOW)
+            return False
         log_debug("Sending post to Bluesky...")
-        client.send_post(text=post_text, embed=embed)
+        call_bluesky(client.send_post, text=post_text, embed=embed, retry_network_errors=False)
+
+        # Posted, so the cached thumbnail is no longer needed
+        thumbnail_blob_cache.pop(video_id, None)
         
         log_success(f"✓ Posted successfully with preview: {video_title}")
         return True
@@ -1405,12 +3238,250 @@ def post_to_bluesky(video_title, video_url):
         # Something went wrong - log the error
         # Common errors: invalid credentials, rate limiting, network issues
         log_exception(f"Error posting to Bluesky for video '{video_title}'", e)
+
+        # Unless it was a network problem or rate limit, don't trust the
+        # uploaded thumbnail - upload a fresh one on the next attempt
+        if not is_transient_bluesky_error(e):
+            thumbnail_blob_cache.pop(video_id, None)
+
+        # If Bluesky rejected our session (e.g. the refresh token expired),
+        # forget the client so the next attempt logs in again
+        err_str = str(e).lower()
+        if "token" in err_str or "unauthorized" in err_str or "authentication" in err_str:
+            log_warning("Bluesky session is no longer valid, will log in again on next attempt")
+            reset_bluesky_client()
+        return False
+
+
+def get_websub_topic():
+    """
+    Returns the WebSub topic URL for the configured YouTube channel.
+    
+    This is the channel's feed URL as registered with the hub.
+    """
+    channel_id = config.get("youtube_channel_id", "")
+    return f"https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}"
+
+
+def make_websub_handler():
+    """
+    Builds the HTTP handler class for the WebSub callback server.
+    
+    The class is defined here rather than at module level so the
+    http.server, urllib.parse, hmac and hashlib modules are only
+    imported when --push is used.
+    
+    Returns:
+        The WebSubHandler class
+    """
+    from http.server import BaseHTTPRequestHandler
+    from urllib.parse import urlparse, parse_qs
+    import hmac
+    import hashlib
+
+    class WebSubHandler(BaseHTTPRequestHandler):
+        """
+        HTTP handler for the WebSub callback URL.
+        
+        - GET: the hub verifies our subscription by sending a challenge,
+          which we echo back if the topic is the one we subscribed to
+        - POST: the hub delivers a notification (an Atom feed with the new
+          or updated video), which we parse and hand to the main loop
+        """
+
+        def do_GET(self):
+            """Answers the hub's subscription verification request."""
+            global websub_secret
+            global websub_pending_secret
+
+            query = parse_qs(urlparse(self.path).query)
+            mode = query.get("hub.mode", [""])[0]
+            topic = query.get("hub.topic", [""])[0]
+            challenge = query.get("hub.challenge", [""])[0]
+
+            # Only confirm subscriptions for our own channel
+            if mode not in ("subscribe", "unsubscribe") or topic != get_websub_topic() or not challenge:
+                log_debug("Rejected WebSub verification: mode=%s, topic=%s", mode, topic)
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            log_debug("WebSub %s verified for topic %s", mode, topic)
+            if mode == "subscribe":
+                log_success("WebSub subscription confirmed by hub")
+                # The hub now uses the secret of the renewal it confirmed
+                if websub_pending_secret is not None:
+                    websub_secret = websub_pending_secret
+                    websub_pending_secret = None
+
+            # Echo the challenge to confirm
+            body = challenge.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            """Receives a push notification and queues its video entries."""
+            # A negative or non-numeric length is a malformed request
+            length = self.headers.get("Content-Length", "0").strip()
+            if not length.isdigit():
+                self.send_response(400)
+                self.end_headers()
+                return
+
+            # Don't buffer huge bodies from clients we can't verify yet;
+            # close the connection instead of reading what they send
+            if int(length) > MAX_WEBSUB_BODY_BYTES:
+                log_warning(f"Refused WebSub notification of {length} bytes (limit is {MAX_WEBSUB_BODY_BYTES})")
+                self.close_connection = True
+                self.send_response(413)
+                self.send_header("Connection", "close")
+                self.end_headers()
+                return
+            body = self.rfile.read(int(length))
+
+            # Always answer 2xx - the hub would otherwise keep re-sending
+            self.send_response(204)
+            self.end_headers()
+
+            # No secret yet means we haven't subscribed, so nothing can be
+            # verified and nobody should be pushing to us
+            known_secrets = [secret for secret in (websub_secret, websub_pending_secret) if secret]
+            if not known_secrets:
+                log_warning("Ignored WebSub notification received before subscribing")
+                return
+
+            # Ignore notifications that are not signed with one of our secrets
+            signature = self.headers.get("X-Hub-Signature")
+            if not signature:
+                log_warning("Ignored unsigned WebSub notification")
+                return
+            if not any(
+                hmac.compare_digest(signature, "sha1=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha1).hexdigest())
+                for secret in known_secrets
+            ):
+                log_warning("Ignored WebSub notification with an invalid signature")
+                return
+
+            try:
+                entries = [entry for entry in iter_feed_entries(io.BytesIO(body)) if entry["yt_videoid"]]
+            except ET.ParseError as e:
+                log_warning(f"Could not parse WebSub notification: {e}")
+                return
+
+            # The hub also pushes when an old video's title or description is
+            # edited. Anything published before this run started was already
+            # covered by the first feed check, so only pass on newer videos
+            fresh_entries = []
+            for entry in entries:
+                published = parse_published_date(entry["published"])
+                if published is not None and published >= websub_started_at:
+                    fresh_entries.append(entry)
+                else:
+                    log_debug("Ignored WebSub push for older video %s (published %s)",
+                              entry["yt_videoid"], entry["published"] or "unknown")
+            entries = fresh_entries
+
+            # Deleted videos arrive as <deleted-entry>, which has no video entries
+            if entries:
+                log_message(f"WebSub notification received for {len(entries)} video(s)", Colors.CYAN)
+                push_queue.put(entries)
+                wakeup_event.set()
+
+        def log_message(self, format, *args):
+            """Sends the HTTP server's request log to the debug log instead of stderr."""
+            log_debug("WebSub callback: " + format, *args)
+
+    return WebSubHandler
+
+
+def start_websub_server():
+    """
+    Starts the WebSub callback HTTP server in a background thread.
+    
+    Listens on push_listen_address:push_port from config.
+    
+    Returns:
+        True if the server started, False otherwise
+    """
+    address = config.get("push_listen_address", "0.0.0.0")
+    port = config.get("push_port", 8080)
+
+    from http.server import ThreadingHTTPServer
+
+    try:
+        server = ThreadingHTTPServer((address, port), make_websub_handler())
+    except (OSError, OverflowError, TypeError) as e:
+        log_exception(f"Could not start WebSub callback server on {address}:{port}", e)
+        return False
+
+    # Daemon thread so it stops together with the script
+    thread = threading.Thread(target=server.serve_forever, name="skytube-websub", daemon=True)
+    thread.start()
+    log_message(f"WebSub callback server listening on {address}:{port}")
+    return True
+
+
+def subscribe_websub():
+    """
+    Subscribes to upload notifications for the channel at the WebSub hub.
+    
+    The hub confirms asynchronously by calling our callback URL (see
+    WebSubHandler.do_GET in make_websub_handler()). If the subscription
+    fails, the script keeps working through normal polling.
+    
+    The new secret is only used once the hub accepted the request, and
+    the previous one stays valid until the hub confirms the renewal, so
+    no notifications are lost while it switches over.
+    
+    Returns:
+        True if the hub accepted the request, False otherwise
+    """
+    global websub_secret
+    global websub_pending_secret
+    import secrets
+
+    # A new secret for every subscription, so old ones can't be replayed
+    new_secret = secrets.token_hex(20)
+
+    data = {
+        "hub.mode": "subscribe",
+        "hub.topic": get_websub_topic(),
+        "hub.callback": config.get("push_callback_url", ""),
+        "hub.verify": "async",
+        "hub.lease_seconds": str(WEBSUB_LEASE_SECONDS),
+        "hub.secret": new_secret,
+    }
+
+    log_message(f"Subscribing to WebSub notifications via {WEBSUB_HUB_URL}...")
+    try:
+        response = http_session.post(WEBSUB_HUB_URL, data=data, timeout=30)
+    except requests.exceptions.RequestException as e:
+        log_exception("WebSub subscription request failed", e)
+        log_warning("Falling back to polling only")
+        return False
+
+    # The hub answers 202 Accepted and verifies the callback afterwards
+    if response.status_code not in (202, 204):
+        log_warning(f"WebSub hub rejected the subscription (HTTP {response.status_code}): {response.text[:200]}")
+        log_warning("Falling back to polling only")
         return False
 
+    log_debug("WebSub subscription request accepted (HTTP %s)", response.status_code)
+
+    # The first subscription has no old secret to keep
+    if websub_secret is None:
+        websub_secret = new_secret
+    else:
+        websub_pending_secret = new_secret
+    return True
+
 
 def build_database():
     """
-    Database building mode: Registers all current videos in the JSON file
+    Database building mode: Registers all current videos in the database
     without posting to Bluesky.
     
     This is useful for:
@@ -1449,29 +3520,33 @@ def build_database():
     
     log_message(f"Found {len(entries)} videos in feed")
     
-    # Process each video entry
-    new_count = 0
-    for entry in entries:
-        # Extract the video ID from the entry
-        # YouTube RSS uses 'yt_videoid' or falls back to 'id'
-        video_id = entry.get("yt_videoid", entry.get("id", ""))
-        video_title = entry.get("title", "Unknown")
-        
-        # Check if this video is new to us
-        if video_id and video_id not in seen_videos:
-            # Add to our set of seen videos
-            seen_videos.add(video_id)
-            new_count += 1
-            log_success(f"  ✓ Registered: {video_title}")
-        elif not video_id:
-            # Log a warning if a feed entry has no video ID (shouldn't happen normally)
-            log_warning(f"  ⚠ Skipped entry with no video ID: {video_title}")
-        else:
-            # Already in database
-            log_message(f"  - Already known: {video_title}")
+    # Map each video ID to its title in one pass
+    # YouTube RSS uses 'yt_videoid' or falls back to 'id'
+    titles = {(entry.get("yt_videoid") or entry.get("id") or ""): entry.get("title", "Unknown") for entry in entries}
+
+    # Log a warning if a feed entry has no video ID (shouldn't happen normally)
+    if "" in titles:
+        del titles[""]
+        for entry in entries:
+            if not (entry.get("yt_videoid") or entry.get("id")):
+                log_warning(f"  ⚠ Skipped entry with no video ID: {entry.get('title', 'Unknown')}")
+
+    # Everything not already in the database is new (one set difference)
+    new_ids = titles.keys() - seen_videos
+    seen_videos |= new_ids
+    new_count = len(new_ids)
+
+    # The per-video list goes to the log file only, so building a database
+    # for a channel with thousands of videos doesn't flood the console
+    if debug_log_enabled:
+        for video_id, video_title in titles.items():
+            if video_id in new_ids:
+                log_debug("  Registered: %s (%s)", video_title, video_id)
+            else:
+                log_debug("  Already known: %s (%s)", video_title, video_id)
     
-    # Save the updated database to disk
-    save_seen_videos(seen_videos)
+    # Save the newly registered videos to the database
+    add_seen_videos(new_ids)
     
     # Display summary
     log_message("=" * 50)
@@ -1483,7 +3558,7 @@ def build_database():
     log_message("You can now run the script normally to post only NEW videos.", Colors.CYAN)
 
 
-def check_for_new_videos(seen_videos):
+def check_for_new_videos(seen_videos, entries=None):
     """
     Checks the YouTube feed for new videos and posts them to Bluesky.
     
@@ -1495,14 +3570,29 @@ def check_for_new_videos(seen_videos):
     
     Args:
         seen_videos: Set of video IDs we've already posted about
+        entries: Optional list of video entries to check instead of fetching
+                 the feed (used for WebSub push notifications)
         
     Returns:
         Updated set of seen video IDs
     """
+    global last_check_new_count, upload_gap_seconds
+
     log_debug("Starting check for new videos...")
+    last_check_new_count = 0
 
     # Fetch the latest videos from YouTube (RSS or API based on flag)
-    entries = get_videos()
+    # unless they were already delivered by a push notification
+    if entries is None:
+        entries = get_videos(seen_videos)
+
+        # Remember how often the channel uploads (push notifications
+        # only carry one video, so they are left out)
+        if entries:
+            upload_gap = get_upload_gap(entries)
+            if upload_gap is not None:
+                upload_gap_seconds = upload_gap
+                log_debug("Average time between recent uploads: %.0f seconds", upload_gap)
     
     # Check if we got any videos
     if not entries:
@@ -1516,17 +3606,46 @@ def check_for_new_videos(seen_videos):
     post_success = 0
     post_failed = 0
 
-    # Process each video in the feed
-    for entry in entries:
+    # Drop the videos we've already posted about up front, in one pass.
+    # Usually that's all of them, so the loop below rarely runs at all.
+    # A list (not a set difference) keeps the feed's order for posting.
+    new_entries = [
+        entry for entry in entries
+        if (entry.get("yt_videoid") or entry.get("id") or "") not in seen_videos
+    ]
+    log_debug("%s of %s feed entries are not seen yet", len(new_entries), len(entries))
+
+    # With more than one new video, download all their thumbnails up front.
+    # Videos with a still usable thumbnail from a failed post are skipped
+    # (stale ones are dropped here, so they get downloaded again), and so
+    # are IDs that aren't plain video IDs.
+    if len(new_entries) > 1:
+        prefetch_ids = []
+        for entry in new_entries:
+            video_id = entry.get("yt_videoid") or entry.get("id") or ""
+            if get_cached_thumbnail_blob(video_id) is not None:
+                continue
+            if BARE_VIDEO_ID_PATTERN.fullmatch(video_id):
+                prefetch_ids.append(video_id)
+        prefetch_thumbnails(prefetch_ids)
+
+    # Process each new video in the feed
+    for entry in new_entries:
+        # Stop between posts if we were asked to shut down; the videos
+        # not posted yet aren't marked as seen, so the next run posts them
+        if stop_event.is_set():
+            log_message("Stop requested, leaving the remaining new videos for the next run", Colors.YELLOW)
+            break
+
         # Extract the video ID from the entry
         # YouTube RSS entries have various ID formats
-        video_id = entry.get("yt_videoid", entry.get("id", ""))
+        video_id = entry.get("yt_videoid") or entry.get("id") or ""
         
         # Get video details for posting
         video_title = entry.get("title", "New Video")
         video_url = entry.get("link", "")
-        
-        # Skip if we've already posted about this video
+
+        # Skip a repeat of a video posted earlier in this same loop
         if video_id in seen_videos:
             continue
 
@@ -1541,23 +3660,22 @@ def check_for_new_videos(seen_videos):
         # This is a new video - highlight it
         new_found += 1
         log_message(f"New video found: {video_title}", Colors.MAGENTA)
-        log_debug(f"New video details — ID: {video_id}, URL: {video_url}, Title: {video_title}")
+        log_debug("New video details — ID: %s, URL: %s, Title: %s", video_id, video_url, video_title)
         
         # Attempt to post to Bluesky
-        if post_to_bluesky(video_title, video_url):
+        if post_to_bluesky(video_id, video_title, video_url):
             # Success! Add to our database so we don't post again
             post_success += 1
             seen_videos.add(video_id)
             # Save immediately in case the script crashes later
-            save_seen_videos(seen_videos)
+            add_seen_videos([video_id])
         else:
             # Posting failed — log but don't add to seen (will retry next cycle)
             post_failed += 1
             log_warning(f"Will retry posting '{video_title}' on next check cycle")
-        
-        # Wait between posts to avoid rate limiting
-        # Bluesky has rate limits on how fast you can post
-        time.sleep(2)
+
+    # Let the main loop know whether this cycle found anything
+    last_check_new_count = new_found
 
     # Log a summary of this check cycle
     if new_found > 0:
@@ -1579,6 +3697,8 @@ def parse_arguments():
         --use-api: Use YouTube Data API instead of RSS feed
         --log: Enable continuous file logging to skytube.log
         --no-cache: Disable caching for YouTube API requests
+        --dual-mode: Use both RSS feed and YouTube Data API
+        --push: Receive WebSub push notifications for new uploads
 
     Returns:
         The parsed arguments object (argparse.Namespace)
@@ -1602,6 +3722,7 @@ Examples:
   python youtube_to_bluesky.py --use-api --no-cache         # Disable API caching (fresh data)
   python youtube_to_bluesky.py --dual-mode                  # Use both RSS and API
   python youtube_to_bluesky.py --dual-mode --no-cache       # Dual mode with no caching
+  python youtube_to_bluesky.py --push                       # Get instant upload notifications
         """
     )
     
@@ -1648,7 +3769,8 @@ Examples:
         "--no-cache",
         action="store_true",
         help="Disable caching for YouTube API requests by adding cache-control headers "
-             "and unique timestamps. Useful when the API returns stale data."
+             "and unique timestamps, and always download the full RSS feed. "
+             "Useful when the API returns stale data."
     )
 
     # --dual-mode flag: use both RSS and API for maximum reliability
@@ -1662,6 +3784,16 @@ Examples:
              "a video is found in both. Requires 'youtube_api_key' in config."
     )
     
+    # --push flag: receive WebSub push notifications for new uploads
+    # Regular checks keep running as a fallback
+    parser.add_argument(
+        "--push",
+        action="store_true",
+        help="Receive instant WebSub (PubSubHubbub) notifications from YouTube for new uploads. "
+             "Requires 'push_callback_url' in config, reachable from the internet. "
+             "Regular checks keep running as a fallback."
+    )
+
     # Parse and return the arguments
     return parser.parse_args()
 
@@ -1670,6 +3802,29 @@ Examples:
 # MAIN LOOP - This is where the script starts running
 # ============================================================
 
+def request_stop(signum, frame):
+    """
+    Signal handler for Ctrl+C (SIGINT) and SIGTERM.
+    
+    The first signal only asks the main loop to stop. A check that is
+    running finishes the video it is posting (so a video is never left
+    half-posted) and leaves the rest for the next run, and the waits
+    between checks and retries end right away. A second signal exits
+    immediately through sys.exit(), which main() reports.
+    
+    Args:
+        signum: The signal number
+        frame: The current stack frame (unused)
+    """
+    if stop_event.is_set():
+        # Asked twice - stop now, even in the middle of a check
+        # SystemExit isn't caught by the "except Exception" handlers,
+        # and ends the script without a traceback
+        sys.exit(128 + signum)
+    stop_event.set()
+    wakeup_event.set()
+
+
 def main():
     """
     Main function that handles different modes based on command line arguments.
@@ -1686,21 +3841,32 @@ def main():
     global file_logger
     global no_cache
     global dual_mode
+    global push_mode
+    global debug_log_enabled
+    global config_path
+    global config_mtime
 
     # Parse command line arguments (--config, --build-db, --use-api, --log, --no-cache, --dual-mode)
     args = parse_arguments()
 
+    # Don't write color escape codes when output is not a terminal,
+    # or when the user asked for plain output with NO_COLOR (no-color.org)
+    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        Colors.disable()
+
     # Set global flags from command line arguments
     use_youtube_api = args.use_api
     no_cache = args.no_cache
     dual_mode = args.dual_mode
+    push_mode = args.push
 
     # ==========================================
     # Set up file logging if --log flag was passed
     # ==========================================
     if args.log:
         file_logger = setup_file_logging()
-        log_message(f"File logging enabled — writing to {os.path.join(os.getcwd(), LOG_FILE_NAME)}", Colors.BLUE)
+        debug_log_enabled = file_logger.isEnabledFor(logging.DEBUG)
+        log_message(f"File logging enabled — writing to {LOG_FILE_PATH}", Colors.BLUE)
     
     # Load configuration from the YAML file
     loaded_config = load_config(args.config)
@@ -1712,33 +3878,35 @@ def main():
     
     # Store the loaded config in the global variable
     config = loaded_config
+
+    # Remember where the config came from so it can be reloaded when edited
+    config_path = args.config
+    config_mtime = os.stat(config_path).st_mtime
     
     # Validate configuration based on the mode we're running in
     if args.build_db:
         # For database building, we only need the YouTube channel ID
         # (and API key if using --use-api)
-        if not config.get("youtube_channel_id") or config.get("youtube_channel_id") == "YOUR_CHANNEL_ID_HERE":
+        if not config_value_is_set("youtube_channel_id", config.get("youtube_channel_id")):
             log_error("youtube_channel_id is required in config file")
             sys.exit(1)
         
         # If using API mode or dual mode, also validate API key
         if use_youtube_api or dual_mode:
-            api_key = config.get("youtube_api_key", "")
-            if not api_key or api_key == "YOUR_YOUTUBE_API_KEY_HERE":
+            if not config_value_is_set("youtube_api_key", config.get("youtube_api_key")):
                 log_error("youtube_api_key is required when using --use-api or --dual-mode flag")
-                print()
-                print(f"{Colors.YELLOW}  To get a YouTube API key:{Colors.RESET}")
-                print(f"{Colors.YELLOW}    1. Go to https://console.cloud.google.com/apis/credentials{Colors.RESET}")
-                print(f"{Colors.YELLOW}    2. Create a new project (or select existing){Colors.RESET}")
-                print(f"{Colors.YELLOW}    3. Enable the 'YouTube Data API v3'{Colors.RESET}")
-                print(f"{Colors.YELLOW}    4. Create an API key under 'Credentials'{Colors.RESET}")
-                print()
+                print_block([""] + api_key_help_lines())
                 sys.exit(1)
     else:
         # For normal operation, we need all credentials
         # Pass require_api_key=True if using API mode or dual mode
         if not validate_config(config, require_api_key=(use_youtube_api or dual_mode)):
             sys.exit(1)
+
+        # Push mode needs a public URL the hub can call back
+        if push_mode and not config.get("push_callback_url"):
+            log_error("push_callback_url is required in config file when using --push")
+            sys.exit(1)
     
     # Check if we're in database building mode
     if args.build_db:
@@ -1761,6 +3929,8 @@ def main():
         log_message("Video source: YouTube Data API", Colors.BLUE)
     else:
         log_message("Video source: RSS Feed", Colors.BLUE)
+    if push_mode:
+        log_message(f"Push notifications: ENABLED ({config.get('push_callback_url')})", Colors.BLUE)
     if no_cache:
         log_message("Cache control: DISABLED (--no-cache)", Colors.YELLOW)
     log_message(f"Check interval: {config.get('check_interval_seconds', 600)} seconds")
@@ -1772,44 +3942,98 @@ def main():
     seen_videos = load_seen_videos()
     log_message(f"Loaded {len(seen_videos)} previously seen videos")
     
-    # Main monitoring loop - runs forever until script is stopped
-    while True:
-        try:
-            # Check for new videos and post them
-            seen_videos = check_for_new_videos(seen_videos)
+    # Number of check cycles in a row that found no new videos
+    idle_checks = 0
 
-        except KeyboardInterrupt:
-            # User pressed Ctrl+C to stop the script — exit gracefully
-            log_message("Received keyboard interrupt (Ctrl+C). Shutting down gracefully...", Colors.YELLOW)
-            log_debug("Script terminated by user via KeyboardInterrupt")
-            break
-            
-        except Exception as e:
-            # Catch any unexpected errors but keep the loop running
-            # This prevents the script from crashing on temporary issues
-            log_exception("Unexpected error during check cycle", e)
-            log_warning("The monitoring loop will continue despite the error above")
-        
-        # Wait before checking again
-        # Get interval from config, default to 600 seconds (10 minutes)
-        check_interval = config.get("check_interval_seconds", 600)
+    # Videos delivered by a push notification, checked instead of fetching
+    pushed_entries = None
 
-        # Validate that the interval is a positive number before sleeping
-        if not isinstance(check_interval, (int, float)) or check_interval <= 0:
-            log_warning(f"Invalid check_interval_seconds ({check_interval}), using default 600 seconds")
-            check_interval = 600
+    # Log in to Bluesky in the background while the first feed fetch runs,
+    # so the first post doesn't have to wait for the login round-trip
+    threading.Thread(target=get_bluesky_client, name="bluesky-login", daemon=True).start()
 
-        log_message(f"Sleeping for {check_interval} seconds...")
+    # When the WebSub subscription was last renewed (0 = never)
+    websub_subscribed_at = 0
+    if push_mode and not start_websub_server():
+        log_warning("Push mode disabled, falling back to polling only")
+        push_mode = False
+
+    # Ctrl+C and SIGTERM (e.g. systemctl stop) set stop_event instead of
+    # interrupting whatever the script is doing at that moment
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    # A second Ctrl+C or SIGTERM exits through sys.exit() in request_stop(),
+    # wherever the loop is at that moment
+    try:
+        # Main monitoring loop - runs until the script is asked to stop
+        while not stop_event.is_set():
+            try:
+                # Pick up any edits to the config file
+                reload_config_if_changed()
+
+                # Subscribe to push notifications, and renew before the lease runs out
+                if push_mode and time.time() - websub_subscribed_at > WEBSUB_RESUBSCRIBE_SECONDS:
+                    if subscribe_websub():
+                        websub_subscribed_at = time.time()
+
+                # Check for new videos and post them
+                seen_videos = check_for_new_videos(seen_videos, pushed_entries)
+                pushed_entries = None
+
+                # Back off while the channel is quiet, reset when something new shows up
+                if last_check_new_count > 0:
+                    idle_checks = 0
+                else:
+                    idle_checks += 1
+
+            except Exception as e:
+                # Catch any unexpected errors but keep the loop running
+                # This prevents the script from crashing on temporary issues
+                log_exception("Unexpected error during check cycle", e)
+                log_warning("The monitoring loop will continue despite the error above")
         
-        try:
-            # Sleep until next check
-            # time.sleep pauses execution for the specified seconds
-            time.sleep(check_interval)
-        except KeyboardInterrupt:
-            # User pressed Ctrl+C during the sleep period — exit gracefully
-            log_message("Received keyboard interrupt during sleep. Shutting down gracefully...", Colors.YELLOW)
-            log_debug("Script terminated by user during sleep via KeyboardInterrupt")
-            break
+            # Wait before checking again
+            # Get interval from config, default to 600 seconds (10 minutes)
+            check_interval = config.get("check_interval_seconds", 600)
+
+            # Validate that the interval is a positive number before sleeping
+            if not isinstance(check_interval, (int, float)) or check_interval <= 0:
+                log_warning(f"Invalid check_interval_seconds ({check_interval}), using default 600 seconds")
+                check_interval = 600
+
+            if config.get("adaptive_check_interval", False):
+                # Follow the channel's upload rhythm instead of backing off
+                # after idle checks
+                check_interval = get_adaptive_interval(check_interval)
+                sleep_seconds = get_sleep_interval(check_interval, 0)
+            else:
+                # Add jitter, the idle backoff (only if turned on in the
+                # config) and any Retry-After from YouTube
+                backoff_checks = idle_checks if config.get("idle_backoff", False) else 0
+                sleep_seconds = get_sleep_interval(check_interval, backoff_checks)
+            log_message(f"Sleeping for {int(sleep_seconds)} seconds...")
+        
+            # Wait until the next check, a push notification, or a stop request
+            wakeup_event.wait(sleep_seconds)
+            wakeup_event.clear()
+
+            if stop_event.is_set():
+                log_message("Received stop request (Ctrl+C or SIGTERM). Shutting down gracefully...", Colors.YELLOW)
+                log_debug("Script terminated by signal")
+                break
+
+            # Collect everything push notifications delivered while we waited
+            if push_mode:
+                while True:
+                    try:
+                        pushed_entries = (pushed_entries or []) + push_queue.get_nowait()
+                    except queue.Empty:
+                        break
+    except SystemExit:
+        log_message("Received second stop request. Stopping immediately...", Colors.YELLOW)
+        log_debug("Script terminated by a second signal")
+        raise
 
     # Log final shutdown message
     log_message("Script stopped.", Colors.CYAN)